@@ -0,0 +1,69 @@
+import queue
+import threading
+
+# How often the Tk event loop checks on a running search, in milliseconds
+POLL_INTERVAL = 100
+
+
+class AISearchWorker:
+    """Runs one AI search on a background thread so the window stays responsive.
+
+    The search works on a copy of the board, so the GUI can keep drawing
+    (and even undo moves) while it runs. The result comes back through a
+    queue that the Tk event loop polls with after(); between polls
+    progress_callback gets the depth completed and nodes searched so far.
+    An exception raised by the search is passed to error_callback, or
+    re-raised in the event loop if there is none.
+    """
+
+    def __init__(self, root, ai, board, done_callback, progress_callback=None, error_callback=None):
+        self.root = root
+        self.ai = ai
+        self.board = board.copy()
+        self.done_callback = done_callback
+        self.progress_callback = progress_callback
+        self.error_callback = error_callback
+        self.results = queue.Queue()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.poll_id = None
+        self.cancelled = False
+
+    def start(self):
+        self.thread.start()
+        self.poll_id = self.root.after(POLL_INTERVAL, self.poll)
+
+    def run(self):
+        try:
+            self.results.put(self.ai.search(self.board, stop_event=self.stop_event))
+        except Exception as error:
+            self.results.put(error)
+
+    def poll(self):
+        self.poll_id = None
+        if self.cancelled:
+            return
+        try:
+            result = self.results.get_nowait()
+        except queue.Empty:
+            if self.progress_callback:
+                self.progress_callback(self.ai.completed_depth, self.ai.nodes)
+            self.poll_id = self.root.after(POLL_INTERVAL, self.poll)
+            return
+        if isinstance(result, Exception):
+            if self.error_callback is None:
+                raise result
+            self.error_callback(result)
+            return
+        move, stats = result
+        self.done_callback(move, stats)
+
+    def cancel(self):
+        """Stop the search and drop its result; returns once the thread has finished."""
+        self.cancelled = True
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join()
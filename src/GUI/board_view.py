@@ -6,10 +6,14 @@ from .piece_view import PieceView
 from .board_themes import ChessBoardThemes
 
 class BoardView:
-    def __init__(self, master, board, cell_callback):
+    def __init__(self, master, board, cell_callback, history_callback=None, can_move_callback=None):
         self.master = master
         self.board = board
         self.cell_callback = cell_callback
+        # Called after an undo or redo changes the position
+        self.history_callback = history_callback
+        # Returns False while the board should ignore clicks, e.g. during the AI's turn
+        self.can_move_callback = can_move_callback
 
         # Initialize pygame mixer for sounds
         pygame.mixer.init()
@@ -183,6 +187,9 @@ class BoardView:
             # Play move sound
             self.play_sound(is_capture=False)
 
+            if self.history_callback:
+                self.history_callback()
+
     def redo_move(self):
         """Redo the previously undone move."""
         if self.undone_moves:
@@ -203,6 +210,9 @@ class BoardView:
             # Play appropriate sound
             self.play_sound(is_capture=bool(move['captured']))
 
+            if self.history_callback:
+                self.history_callback()
+
     def update_undo_redo_buttons(self):
         """Update the enabled/disabled state of undo/redo buttons."""
         self.undo_button.configure(state=tk.NORMAL if self.board.move_history else tk.DISABLED)
@@ -377,16 +387,15 @@ class BoardView:
         
         piece = self.board.get_piece((col, row))
         if piece and piece.color == self.board.current_turn:
-            moves = piece.get_possible_moves(self.board)
-            valid_moves = [
-                move for move in moves 
-                if not self.board.would_be_in_check(piece.color, (col, row), move)]
+            valid_moves = [end for start, end in self.board.get_status().legal_moves if start == (col, row)]
             for move_col, move_row in valid_moves:
                 self.highlight_square(move_col, move_row, self.colors['highlight_moves'])
 
 
     def on_canvas_click(self, event):
         """Handle mouse clicks with piece movement, sound effects, and callback functionality."""
+        if self.can_move_callback and not self.can_move_callback():
+            return
         col, row = self.get_square_from_coords(event.x, event.y)
         if not (0 <= col < 5 and 0 <= row < 6):
             return
@@ -404,15 +413,8 @@ class BoardView:
             from_pos = self.selected_piece
             to_pos = (col, row)
 
-            # Get the piece and its valid moves
-            piece = self.board.get_piece(from_pos)
-            valid_moves = []
-            if piece:
-                moves = piece.get_possible_moves(self.board)
-                valid_moves = [
-                    move for move in moves
-                    if not self.board.would_be_in_check(piece.color, from_pos, move)
-                ]
+            # Get the valid moves of the selected piece
+            valid_moves = [end for start, end in self.board.get_status().legal_moves if start == from_pos]
 
             # If the clicked square is a valid move
             if to_pos in valid_moves:
@@ -452,7 +454,7 @@ class BoardView:
                     self.cell_callback(col, row)
 
         # If the last move resulted in a check, we might want to highlight it
-        if self.board.is_in_check(self.board.current_turn):
+        if self.board.get_status().in_check:
             # You could add visual feedback for check here
             pass
 
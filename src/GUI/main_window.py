@@ -2,7 +2,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from .game_setup import GameSetupDialog
 from .board_view import BoardView
+from .ai_worker import AISearchWorker, POLL_INTERVAL
 from ..game import MinichessGame
+from ..board import CHECKMATE
 
 class MainWindow:
     def __init__(self, root):
@@ -10,6 +12,12 @@ class MainWindow:
         self.root.title("MiniChess")
         self.game = None
         self.selected_piece = None
+        # Background search of the AI to move, and the timer that starts it or plays its move
+        self.ai_worker = None
+        self.ai_timer = None
+        self.ai_thinking = False
+        # Position the AI's move was searched in; the move is only played there
+        self.ai_search_key = None
         
         # Configure root window
         self.root.configure(bg='#f0f0f0')
@@ -57,6 +65,8 @@ class MainWindow:
 
     def start_screen(self):
         """Create the main menu screen"""
+        self.cancel_ai_turn()
+
         # Clear previous widgets
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -94,6 +104,7 @@ class MainWindow:
 
     def setup_game(self):
         """Open game setup dialog"""
+        self.cancel_ai_turn()
         setup_dialog = GameSetupDialog(self.root)
         self.root.wait_window(setup_dialog.window)
         self.game = setup_dialog.start_game()
@@ -136,15 +147,20 @@ class MainWindow:
                                     text=f"{self.game.current_player.capitalize()}'s turn",
                                     style='Status.TLabel')
         self.status_label.pack(pady=5)
+
+        # Shown while the AI is searching
+        self.progress_bar = ttk.Progressbar(info_frame, mode='indeterminate', length=200)
         
         # Create board view
         board_frame = ttk.Frame(game_frame)
         board_frame.pack(expand=True, pady=10)
-        self.board_view = BoardView(board_frame, self.game.board, self.on_cell_clicked)
+        self.board_view = BoardView(board_frame, self.game.board, self.on_cell_clicked,
+                                    history_callback=self.on_history_changed,
+                                    can_move_callback=self.can_human_move)
         
         # If first player is AI, play their turn
         if self.game.players[self.game.current_player]:
-            self.root.after(500, self.play_ai_turn)
+            self.schedule_ai_turn()
 
     def show_game_over(self, winner):
         """Display game over dialog with animations"""
@@ -220,13 +236,13 @@ class MainWindow:
                     text=f"{self.game.current_player.capitalize()}'s turn"
                 )
                 
-                if self.game.board.is_checkmate(self.game.current_player):
+                if self.game.board.get_status().result == CHECKMATE:
                     winner = 'Black' if self.game.current_player == 'white' else 'White'
                     self.show_game_over(winner)
                     return
                 
                 if self.game.players[self.game.current_player]:
-                    self.root.after(500, self.play_ai_turn)
+                    self.schedule_ai_turn()
             else:
                 if piece and piece.color == self.game.current_player:
                     self.selected_piece = (col, row)
@@ -241,20 +257,100 @@ class MainWindow:
                         text=f"Invalid move. {self.game.current_player.capitalize()}'s turn"
                     )
 
+    def can_human_move(self):
+        """Whether the board takes moves: not while the AI is to move, searching or about to move"""
+        return (not self.ai_thinking and self.ai_timer is None
+                and not self.game.players[self.game.current_player])
+
+    def schedule_ai_turn(self):
+        """Start the AI's turn shortly, unless it is cancelled first"""
+        self.ai_timer = self.root.after(500, self.play_ai_turn)
+
     def play_ai_turn(self):
-        """Handle AI player moves"""
+        """Start the AI search in the background; the move is played when it finishes"""
+        self.ai_timer = None
+        if self.ai_worker is not None:
+            return
+        self.ai_search_key = self.game.board.zobrist_key
+        ponderer = self.game.ponderers.get(self.game.current_player)
+        if ponderer is not None and ponderer.is_hit(self.game.board):
+            if not ponderer.running:
+                self.finish_ponder(ponderer)
+                return
+            self.show_ai_thinking()
+            self.wait_for_ponder(ponderer)
+            return
+        if ponderer is not None:
+            ponderer.cancel()
+        self.start_ai_search()
+
+    def start_ai_search(self):
+        """Search the current position on a background worker"""
         ai_player = self.game.players[self.game.current_player]
-        start_pos, end_pos = ai_player.get_best_move(self.game.board)
-        
+        self.show_ai_thinking()
+        self.ai_worker = AISearchWorker(self.root, ai_player, self.game.board,
+                                        self.on_ai_move_found, self.on_ai_progress, self.on_ai_error)
+        self.ai_worker.start()
+
+    def show_ai_thinking(self):
+        self.ai_thinking = True
+        self.status_label.configure(text=f"{self.game.current_player.capitalize()} (AI) is thinking...")
+        self.progress_bar.pack(pady=(0, 5))
+        self.progress_bar.start(10)
+
+    def hide_ai_thinking(self):
+        if self.ai_thinking:
+            self.ai_thinking = False
+            self.progress_bar.stop()
+            self.progress_bar.pack_forget()
+
+    def wait_for_ponder(self, ponderer):
+        """Poll a ponder search that hit until it finishes, then play its move"""
+        self.ai_timer = None
+        if ponderer.running:
+            self.on_ai_progress(ponderer.ai.completed_depth, ponderer.ai.nodes)
+            self.ai_timer = self.root.after(POLL_INTERVAL, self.wait_for_ponder, ponderer)
+            return
+        self.finish_ponder(ponderer)
+
+    def finish_ponder(self, ponderer):
+        """Play the move of a finished ponder search, or search again if it failed"""
+        result = ponderer.wait()
+        if result is None:
+            self.start_ai_search()
+            return
+        self.on_ai_move_found(*result)
+
+    def on_ai_progress(self, depth, nodes):
+        self.status_label.configure(
+            text=f"{self.game.current_player.capitalize()} (AI) is thinking... depth {depth}, {nodes:,} nodes"
+        )
+
+    def on_ai_move_found(self, move, stats):
+        """Show the AI's move for a moment before playing it"""
+        self.ai_worker = None
+        self.hide_ai_thinking()
+        if move is None or self.game.board.zobrist_key != self.ai_search_key:
+            return
+        start_pos, end_pos = move
         self.board_view.highlight_selected(*start_pos)
         self.status_label.configure(
             text=f"AI moving {chr(start_pos[0]+97)}{start_pos[1]+1} to {chr(end_pos[0]+97)}{end_pos[1]+1}"
         )
-        self.root.update()
-        
-        self.root.after(500)
-        
-        self.game.board.move_piece(start_pos, end_pos)
+        self.ai_timer = self.root.after(500, self.make_ai_move, start_pos, end_pos)
+
+    def make_ai_move(self, start_pos, end_pos):
+        """Play the AI's move on the board"""
+        self.ai_timer = None
+        if self.game.board.zobrist_key != self.ai_search_key:
+            # The position changed since the search; its move may not even be legal now
+            return
+        if not self.game.board.move_piece(start_pos, end_pos):
+            self.board_view.update(self.game.board)
+            self.status_label.configure(
+                text=f"AI move {chr(start_pos[0]+97)}{start_pos[1]+1} to {chr(end_pos[0]+97)}{end_pos[1]+1} was rejected"
+            )
+            return
         self.board_view.update(self.game.board)
         
         self.game.current_player = 'black' if self.game.current_player == 'white' else 'white'
@@ -262,6 +358,46 @@ class MainWindow:
             text=f"{self.game.current_player.capitalize()}'s turn"
         )
         
-        if self.game.board.is_checkmate(self.game.current_player):
+        if self.game.board.get_status().result == CHECKMATE:
             winner = 'Black' if self.game.current_player == 'white' else 'White'
-            self.show_game_over(winner)
\ No newline at end of file
+            self.show_game_over(winner)
+            return
+
+        if self.game.players[self.game.current_player]:
+            self.schedule_ai_turn()
+        else:
+            # The AI that just moved thinks on the human's time
+            ponderer = self.game.ponderers.get('black' if self.game.current_player == 'white' else 'white')
+            if ponderer is not None:
+                ponderer.start(self.game.board)
+
+    def on_ai_error(self, error):
+        """Clear the failed search so a new one can start, then report the error"""
+        self.ai_worker = None
+        self.hide_ai_thinking()
+        self.status_label.configure(text=f"AI search failed: {error}")
+        raise error
+
+    def cancel_ai_turn(self):
+        """Stop a running or scheduled AI search and drop any move it is about to play"""
+        if self.ai_worker is not None:
+            self.ai_worker.cancel()
+            self.ai_worker = None
+        if self.ai_timer is not None:
+            self.root.after_cancel(self.ai_timer)
+            self.ai_timer = None
+        if self.game is not None:
+            for ponderer in self.game.ponderers.values():
+                ponderer.cancel()
+        self.hide_ai_thinking()
+
+    def on_history_changed(self):
+        """After undo or redo, the side to move may have changed under a running search"""
+        self.cancel_ai_turn()
+        self.selected_piece = None
+        self.game.current_player = self.game.board.current_turn
+        self.status_label.configure(
+            text=f"{self.game.current_player.capitalize()}'s turn"
+        )
+        if self.game.players[self.game.current_player]:
+            self.schedule_ai_turn()
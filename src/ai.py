@@ -1,93 +1,493 @@
-import random
-from copy import deepcopy
-from .board import Board
-from .piece import Piece, Pawn, Rook, Knight, Bishop, Queen, King
+import time
+from .transposition import TranspositionTable, SharedTranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from .move_ordering import MoveOrderer
+from .opening_book import OpeningBook
+from .evaluation import PIECE_VALUES
+from .tablebase import Tablebases
+from .search_stats import SearchStats
+
+# Score of delivering mate at the root; mates found deeper score a little less
+MATE_SCORE = 100000
+MATE_BOUND = MATE_SCORE - 1000
+MAX_DEPTH = 64
+# Quiescence skips captures that cannot lift the score to alpha even with this margin
+DELTA_MARGIN = 200
+INFINITY = MATE_SCORE + 1
+# Half-width of the first aspiration window around the previous iteration's score
+ASPIRATION_WINDOW = 50
+ASPIRATION_LIMIT = 800
+# Null-move pruning searches the pass NULL_MOVE_REDUCTION plies shallower
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_MIN_DEPTH = 3
+# Late move reductions apply to quiet moves after the first few at a node
+LMR_MIN_DEPTH = 3
+LMR_FULL_DEPTH_MOVES = 3
+LMR_DEEPER_MOVES = 8
+# How many nodes are searched between clock checks
+TIME_CHECK_INTERVAL = 256
+# Shallower iterations finish too quickly to be worth sending to worker processes
+PARALLEL_MIN_DEPTH = 3
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when its time or node budget runs out."""
+
+
+def score_to_tt(score, ply):
+    """Make mate scores relative to the node before caching them."""
+    if score > MATE_BOUND:
+        return score + ply
+    if score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_tt(score, ply):
+    """Make a cached mate score relative to the root again."""
+    if score > MATE_BOUND:
+        return score - ply
+    if score < -MATE_BOUND:
+        return score + ply
+    return score
+
+
+def tablebase_score(value, ply):
+    """Turn a tablebase probe into a search score, mate distances included."""
+    if not value:
+        return 0
+    distance = value - 1
+    if distance % 2:
+        return MATE_SCORE - ply - distance
+    return -(MATE_SCORE - ply - distance)
+
 
 class MinichessAI:
-    def __init__(self, color, depth=3):
+    def __init__(self, color, depth=3, tt_size_mb=16, time_limit=None, node_limit=None,
+                 use_quiescence=True, use_pvs=True, use_aspiration=True,
+                 use_null_move=True, use_lmr=True, workers=None, tt=None, book_path=None,
+                 tablebase_dir=None, stats_log=None):
         self.color = color
+        # Deepest iteration to search; None searches until a budget runs out
         self.depth = depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        # Resolve captures and checks at the horizon instead of evaluating mid-exchange
+        self.use_quiescence = use_quiescence
+        # Null-window scouts for non-PV moves, and narrow root windows around the last score
+        self.use_pvs = use_pvs
+        self.use_aspiration = use_aspiration
+        self.aspiration_researches = 0
+        # Selective search: skip subtrees a free pass already refutes, and reduce late quiet moves
+        self.use_null_move = use_null_move
+        self.use_lmr = use_lmr
+        self.null_move_cutoffs = 0
+        self.lmr_researches = 0
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self.completed_depth = 0
+        self.deadline = None
+        self.max_nodes = None
+        self.next_check = 0
+        # Root moves of the final iteration are split across this many processes; None stays serial
+        self.workers = workers
+        # Kept across moves so long games reuse earlier work without growing memory.
+        # A parallel search shares one table with its workers.
+        if tt is None:
+            tt = TranspositionTable(tt_size_mb) if workers is None else SharedTranspositionTable(tt_size_mb)
+        self.tt = tt
+        self.orderer = MoveOrderer()
+        self.parallel = None
+        # Positions in the book are answered without searching
+        self.book = OpeningBook(book_path) if book_path else None
+        # Positions with little enough material are scored exactly from the tables
+        self.tablebases = Tablebases(tablebase_dir) if tablebase_dir else None
+        self.tablebase_hits = 0
+        self.search_settings = {
+            'use_quiescence': use_quiescence, 'use_pvs': use_pvs,
+            'use_aspiration': use_aspiration, 'use_null_move': use_null_move, 'use_lmr': use_lmr,
+            'tablebase_dir': tablebase_dir
+        }
+        # Statistics of the last search, also appended to stats_log as JSON lines if given
+        self.stats_log = stats_log
+        self.last_stats = None
+        # Event that ends the running search early once set from another thread
+        self.stop_event = None
 
     def evaluate_board(self, board):
-        piece_values = {
-            Pawn: 100,
-            Knight: 320,
-            Bishop: 330,
-            Rook: 500,
-            Queen: 900,
-            King: 20000
-        }
-        
-        score = 0
-        for row in range(6):  # 6 rows
-            for col in range(5):  # 5 columns
-                piece = board.get_piece((col, row))
-                if piece:
-                    value = piece_values.get(type(piece), 0)  # Safely get piece value
-                    if piece.color == self.color:
-                        score += value
-                    else:
-                        score -= value
-        
-        # Add bonus points for controlling the center
-        center_positions = [(2, 2), (2, 3), (3, 2), (3, 3)]
-        for pos in center_positions:
-            piece = board.get_piece(pos)
-            if piece and piece.color == self.color:
-                score += 50
-            elif piece and piece.color != self.color:
-                score -= 50
-        
-        return score
-
-    def minimax(self, board, depth, alpha, beta, maximizing_player):
-        if depth == 0 or board.is_checkmate(self.color) or board.is_stalemate(self.color):
-            return self.evaluate_board(board)
-            
-        if maximizing_player:
-            max_eval = float('-inf')
-            for move in self.get_all_moves(board, self.color):
-                new_board = deepcopy(board)
-                new_board.move_piece(move[0], move[1])
-                eval = self.minimax(new_board, depth - 1, alpha, beta, False)
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
-                if beta <= alpha:
-                    break
-            return max_eval
+        """Material and piece-square score from this player's point of view.
+
+        The board keeps the score up to date as moves are made and unmade,
+        so evaluating a leaf costs nothing.
+        """
+        score = board.eval_score
+        return score if self.color == 'white' else -score
+
+    def check_budget(self):
+        """Abort the search if its node or time budget is used up, or it was stopped."""
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchTimeout()
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise SearchTimeout()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        self.next_check = self.nodes + TIME_CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self.next_check = min(self.next_check, self.max_nodes)
+
+    def evaluate_for_side(self, board):
+        """Evaluate from the point of view of the side to move, as negamax needs."""
+        self.leaf_evaluations += 1
+        score = self.evaluate_board(board)
+        return score if board.current_turn == self.color else -score
+
+    def probe_tablebase(self, board, ply):
+        """Exact score of a position with tablebase material, or None."""
+        tablebases = self.tablebases
+        if tablebases is None:
+            return None
+        if len(board.piece_lists['white']) + len(board.piece_lists['black']) > tablebases.max_pieces:
+            return None
+        value = tablebases.probe(board)
+        if value is None:
+            return None
+        self.tablebase_hits += 1
+        return tablebase_score(value, ply)
+
+    def negamax(self, board, depth, alpha, beta, ply=1, allow_null=True):
+        """Principal variation search; scores are from the side to move's view."""
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.check_budget()
+        alpha_orig = alpha
+        key = board.zobrist_key
+        hash_move = None
+        entry = self.tt.probe(key)
+        if entry:
+            entry_depth, bound, score, hash_move = entry
+            if entry_depth >= depth:
+                score = score_from_tt(score, ply)
+                if bound == EXACT:
+                    return score
+                if bound == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif bound == UPPER_BOUND:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        score = self.probe_tablebase(board, ply)
+        if score is not None:
+            return score
+
+        if depth == 0:
+            if self.use_quiescence:
+                return self.quiescence(board, alpha, beta, ply)
+            return self.evaluate_for_side(board)
+
+        color = board.current_turn
+        in_check = board.is_in_check(color)
+
+        # Null move: if passing still fails high, a real move will too. Not in
+        # pawn/king endings, where having to move (zugzwang) is common.
+        if (self.use_null_move and allow_null and not in_check
+                and depth >= NULL_MOVE_MIN_DEPTH and abs(beta) < MATE_BOUND
+                and board.has_non_pawn_material(color)):
+            board.make_null_move()
+            score = -self.negamax(board, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1, False)
+            board.unmake_null_move()
+            if score >= beta:
+                self.null_move_cutoffs += 1
+                return beta
+
+        moves = self.get_all_moves(board, color)
+        if not moves:
+            # Checkmate or stalemate; prefer faster mates and slower losses
+            if not in_check:
+                return 0
+            return -(MATE_SCORE - ply)
+        moves = self.orderer.order_moves(board, moves, ply, hash_move)
+        killers = self.orderer.killers[ply] if ply < len(self.orderer.killers) else ()
+        pv_node = beta - alpha > 1
+        king_pos = board.king_positions.get(color)
+        # Against a king without pieces the win is a quiet mating net, so nothing is reduced
+        allow_lmr = (self.use_lmr and depth >= LMR_MIN_DEPTH and not pv_node and not in_check
+                     and board.has_non_pawn_material('black' if color == 'white' else 'white'))
+
+        best_move = None
+        best_score = float('-inf')
+        for index, move in enumerate(moves):
+            is_capture = board.board[move[1][1]][move[1][0]] is not None
+            board.make_move(move[0], move[1])
+
+            # Late move reduction for quiet, non-checking moves ordered late,
+            # outside the principal variation; king moves are never reduced
+            reduction = 0
+            if (allow_lmr and index >= LMR_FULL_DEPTH_MOVES and not is_capture
+                    and move[0] != king_pos and move not in killers
+                    and not board.is_in_check(board.current_turn)):
+                reduction = 2 if index >= LMR_DEEPER_MOVES and depth > 3 else 1
+
+            if index == 0 or not self.use_pvs and not reduction:
+                score = -self.negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            else:
+                # Scout with a null window; re-search only if the move might be better
+                score = -self.negamax(board, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1)
+                if reduction and score > alpha:
+                    self.lmr_researches += 1
+                    score = -self.negamax(board, depth - 1, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    score = -self.negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if score > best_score:
+                best_score, best_move = score, move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self.orderer.record_cutoff(board, move, ply, depth, index, is_capture)
+                break
+
+        if best_score <= alpha_orig:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.tt.store(key, depth, bound, score_to_tt(best_score, ply), best_move)
+        return best_score
+
+    def quiescence(self, board, alpha, beta, ply):
+        """Search captures (and every reply to check) until the position is quiet."""
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.check_budget()
+        score = self.probe_tablebase(board, ply)
+        if score is not None:
+            return score
+
+        color = board.current_turn
+        in_check = board.is_in_check(color)
+        grid = board.board
+        if in_check:
+            # No standing pat while in check: every evasion is searched
+            moves = self.get_all_moves(board, color)
+            if not moves:
+                return -(MATE_SCORE - ply)
+            best_score = float('-inf')
         else:
-            min_eval = float('inf')
-            opponent_color = 'black' if self.color == 'white' else 'white'
-            for move in self.get_all_moves(board, opponent_color):
-                new_board = deepcopy(board)
-                new_board.move_piece(move[0], move[1])
-                eval = self.minimax(new_board, depth - 1, alpha, beta, True)
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break
-            return min_eval
+            stand_pat = self.evaluate_for_side(board)
+            if stand_pat >= beta or ply >= MAX_DEPTH:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+            best_score = stand_pat
+            moves = board.get_legal_moves(color, captures_only=True)
+
+        for move in self.orderer.order_moves(board, moves, ply):
+            # Delta pruning: skip captures that cannot reach the window
+            if not in_check and stand_pat + PIECE_VALUES[type(grid[move[1][1]][move[1][0]])] + DELTA_MARGIN <= alpha:
+                continue
+            board.make_move(move[0], move[1])
+            score = -self.quiescence(board, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        return best_score
 
     def get_all_moves(self, board, color):
-        moves = []
-        pieces = board.get_all_pieces(color)
-        for piece, pos in pieces:
-            for move in piece.get_possible_moves(board):
-                if not board.would_be_in_check(color, pos, move):
-                    moves.append((pos, move))
-        return moves
+        return board.get_legal_moves(color)
+
 
+    def search_root(self, board, moves, depth, previous_best, alpha=-INFINITY, beta=INFINITY):
+        """Search every root move to the given depth, best-first.
 
-    def get_best_move(self, board):
+        Progress is kept in self.root_best so an interrupted iteration can
+        still contribute the moves it finished. Only a move that beat the
+        window's alpha counts: below it a score is just an upper bound, and
+        the previous iteration's move is safer than an unproven one.
+        """
+        alpha_orig = alpha
         best_move = None
-        best_eval = float('-inf')
-        
-        for move in self.get_all_moves(board, self.color):
-            new_board = deepcopy(board)
-            new_board.move_piece(move[0], move[1])
-            eval = self.minimax(new_board, self.depth - 1, best_eval, float('inf'), False)
-            if eval > best_eval:
-                best_eval = eval
-                best_move = move
-                
-        return best_move
+        best_score = float('-inf')
+        self.root_best = None
+        for index, move in enumerate(self.orderer.order_moves(board, moves, 0, previous_best)):
+            board.make_move(move[0], move[1])
+            if index == 0 or not self.use_pvs:
+                score = -self.negamax(board, depth - 1, -beta, -alpha)
+            else:
+                score = -self.negamax(board, depth - 1, -alpha - 1, -alpha)
+                if alpha < score < beta:
+                    score = -self.negamax(board, depth - 1, -beta, -alpha)
+            board.unmake_move()
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha_orig:
+                    self.root_best = (best_move, best_score)
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if alpha_orig < best_score < beta:
+            self.tt.store(board.zobrist_key, depth, EXACT, score_to_tt(best_score, 0), best_move)
+        return best_move, best_score
+
+    def search_with_aspiration(self, board, moves, depth, previous_best, previous_score):
+        """Search the root in a narrow window around the last score, widening on failure."""
+        if not self.use_aspiration or previous_score is None or abs(previous_score) > MATE_BOUND:
+            return self.search_root(board, moves, depth, previous_best)
+
+        delta = ASPIRATION_WINDOW
+        alpha, beta = previous_score - delta, previous_score + delta
+        while True:
+            best_move, best_score = self.search_root(board, moves, depth, previous_best, alpha, beta)
+            if best_score <= alpha:
+                alpha = -INFINITY if delta >= ASPIRATION_LIMIT else best_score - delta
+            elif best_score >= beta:
+                beta = INFINITY if delta >= ASPIRATION_LIMIT else best_score + delta
+                previous_best = best_move
+            else:
+                return best_move, best_score
+            self.aspiration_researches += 1
+            delta *= 4
+
+    def use_parallel_root(self, depth, max_depth):
+        """Whether this iteration runs on the worker pool.
+
+        With a fixed depth only the last iteration is split; a node budget
+        keeps the search serial so its node counts stay reproducible.
+        """
+        if self.workers is None or self.max_nodes is not None or depth < PARALLEL_MIN_DEPTH:
+            return False
+        return self.depth is None or depth == max_depth
+
+    def search_root_parallel(self, board, moves, depth, previous_best):
+        """Like search_root, but with the root moves spread over worker processes."""
+        if self.parallel is None:
+            from .parallel import RootParallelSearch
+            self.parallel = RootParallelSearch(self.workers, self.search_settings, self.tt)
+        self.root_best = None
+        ordered = self.orderer.order_moves(board, moves, 0, previous_best)
+        deadline = time.time() + self.deadline - time.perf_counter() if self.deadline is not None else None
+        best_move, best_score, nodes, complete = self.parallel.search_root(board, ordered, depth, deadline)
+        self.nodes += nodes
+        if best_move is not None:
+            self.root_best = (best_move, best_score)
+        if not complete:
+            raise SearchTimeout()
+        self.tt.store(board.zobrist_key, depth, EXACT, score_to_tt(best_score, 0), best_move)
+        return best_move, best_score
+
+    def close(self):
+        """Stop the worker processes of a parallel search."""
+        if self.parallel is not None:
+            self.parallel.shutdown()
+            self.parallel = None
+
+    def start_search(self, time_limit=None, node_limit=None, stop_event=None):
+        """Reset counters and budgets before a new search."""
+        self.stop_event = stop_event
+        self.tt.new_search()
+        self.tt.reset_stats()
+        self.orderer.new_search()
+        self.orderer.reset_stats()
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self.aspiration_researches = 0
+        self.null_move_cutoffs = 0
+        self.lmr_researches = 0
+        self.tablebase_hits = 0
+        self.completed_depth = 0
+        self.deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        self.max_nodes = node_limit
+        self.next_check = 0
+
+    def predicted_reply(self, board):
+        """The reply the last search expects from the side to move on board.
+
+        This is the next move of the principal variation, read back from
+        the hash move stored for the position; None if there is none.
+        """
+        entry = self.tt.probe(board.zobrist_key)
+        if not entry or entry[3] is None:
+            return None
+        move = entry[3]
+        return move if move in self.get_all_moves(board, board.current_turn) else None
+
+    def get_best_move(self, board, time_limit=None, node_limit=None):
+        """Find the best move; see search, which also returns statistics."""
+        return self.search(board, time_limit, node_limit)[0]
+
+    def search(self, board, time_limit=None, node_limit=None, stop_event=None):
+        """Find the best move with iterative deepening; returns (move, SearchStats).
+
+        Depths 1, 2, 3... are searched in turn up to self.depth, each one
+        trying the previous iteration's best move first. time_limit (in
+        seconds) and node_limit bound the whole search; when either runs
+        out, the best move of the deepest completed work is returned.
+        Positions found in the opening book are answered from it, and
+        positions covered by the tablebases are scored exactly.
+
+        stop_event, a threading.Event owned by the caller, ends the search
+        early once set from another thread; it can be set before the
+        search starts, so stopping never races with starting.
+        """
+        time_limit = self.time_limit if time_limit is None else time_limit
+        node_limit = self.node_limit if node_limit is None else node_limit
+        if self.depth is None and time_limit is None and node_limit is None:
+            raise ValueError("A search without a depth needs a time or node limit")
+
+        self.start_search(time_limit, node_limit, stop_event)
+        stats = SearchStats(self.color, board.to_fen())
+
+        moves = self.get_all_moves(board, self.color)
+        if not moves:
+            return self.finish_search(stats, None)
+        entry = self.tt.probe(board.zobrist_key)
+        best_move = self.orderer.order_moves(board, moves, 0, entry[3] if entry else None)[0]
+        if len(moves) == 1:
+            stats.source = 'only move'
+            return self.finish_search(stats, best_move)
+        if self.book is not None:
+            book_entry = self.book.probe(board.zobrist_key)
+            # A key collision could name a move that is not legal here
+            if book_entry and book_entry[0] in moves:
+                stats.source = 'book'
+                stats.score = book_entry[1]
+                return self.finish_search(stats, book_entry[0])
+
+        history_length = len(board.move_history)
+        max_depth = self.depth if self.depth is not None else MAX_DEPTH
+        best_eval = None
+        for depth in range(1, max_depth + 1):
+            try:
+                if self.use_parallel_root(depth, max_depth):
+                    best_move, best_eval = self.search_root_parallel(board, moves, depth, best_move)
+                else:
+                    best_move, best_eval = self.search_with_aspiration(board, moves, depth, best_move, best_eval)
+            except SearchTimeout:
+                # Unwind the moves the interrupted search left on the board
+                while len(board.move_history) > history_length:
+                    if board.move_history[-1] is None:
+                        board.unmake_null_move()
+                    else:
+                        board.unmake_move()
+                if self.root_best:
+                    best_move = self.root_best[0]
+                break
+            self.completed_depth = depth
+            stats.add_iteration(depth, self.nodes, best_eval, best_move)
+            if abs(best_eval) > MATE_BOUND:
+                break
+
+        return self.finish_search(stats, best_move)
+
+    def finish_search(self, stats, move):
+        """Complete and log the statistics of a search; returns (move, stats)."""
+        stats.finish(self, move)
+        self.last_stats = stats
+        if self.stats_log:
+            stats.write(self.stats_log)
+        return move, stats
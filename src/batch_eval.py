@@ -0,0 +1,95 @@
+import numpy as np
+from .evaluation import SQUARE_SCORES
+from .position import PIECE_CODES, CODE_PIECES, BLACK, NUM_SQUARES, POSITION_BYTES, Position
+
+# One plane per piece type and color: white pawn .. white king, then black
+PLANE_CODES = np.array([code | color for color in (0, BLACK) for code in sorted(CODE_PIECES)], dtype=np.uint8)
+NUM_PLANES = len(PLANE_CODES)
+
+# WEIGHTS[plane, square]: material plus piece-square score from white's point of view
+WEIGHTS = np.array([
+    SQUARE_SCORES[CODE_PIECES[code & 7]]['black' if code & BLACK else 'white'] for code in PLANE_CODES
+], dtype=np.int32)
+
+
+def _plane(piece):
+    return PIECE_CODES[type(piece)] - 1 + (NUM_PLANES // 2 if piece.color == 'black' else 0)
+
+
+def squares_array(positions):
+    """Stack the square codes of Positions into an (n, 30) uint8 array."""
+    data = b''.join(bytes(position.squares) for position in positions)
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, NUM_SQUARES)
+
+
+def encode_planes(squares):
+    """One-hot piece planes, shape (n, 12, 30), from (n, 30) square codes."""
+    return squares[:, np.newaxis, :] == PLANE_CODES[np.newaxis, :, np.newaxis]
+
+
+def evaluate_planes(planes):
+    """Score every position of a plane batch, from white's point of view.
+
+    Scores match Board.eval_score for the same positions.
+    """
+    flat = planes.reshape(len(planes), NUM_PLANES * NUM_SQUARES).astype(np.int32)
+    return flat @ WEIGHTS.reshape(-1)
+
+
+def evaluate_positions(positions):
+    """Scores of a sequence of Positions as an int array, from white's point of view."""
+    return evaluate_planes(encode_planes(squares_array(positions)))
+
+
+def board_planes(board):
+    """Piece planes of a single board, shape (12, 30)."""
+    planes = np.zeros((NUM_PLANES, NUM_SQUARES), dtype=bool)
+    for color in ('white', 'black'):
+        for piece in board.piece_lists[color]:
+            x, y = piece.position
+            planes[_plane(piece), y * 5 + x] = True
+    return planes
+
+
+def evaluate_children(board, moves):
+    """Scores after each of moves, from white's point of view, in one batch.
+
+    The board's planes are copied once per move and each copy has the
+    moving piece lifted and dropped (and any captured piece removed),
+    so the children are scored with a single matrix product.
+    """
+    planes = np.repeat(board_planes(board)[np.newaxis], len(moves), axis=0)
+    grid = board.board
+    for index, ((start_x, start_y), (end_x, end_y)) in enumerate(moves):
+        moving = _plane(grid[start_y][start_x])
+        end = end_y * 5 + end_x
+        captured = grid[end_y][end_x]
+        if captured:
+            planes[index, _plane(captured), end] = False
+        planes[index, moving, start_y * 5 + start_x] = False
+        planes[index, moving, end] = True
+    return evaluate_planes(planes)
+
+
+def read_position_file(path):
+    """Load a position file as (squares, black_to_move) arrays.
+
+    A file of POSITION_BYTES records, as written by Position.to_bytes, is
+    mapped straight into an array; any other file is read as one FEN per
+    line.
+    """
+    with open(path, 'rb') as position_file:
+        data = position_file.read()
+    if path.endswith('.bin'):
+        if len(data) % POSITION_BYTES:
+            raise ValueError(f"{path} is not a whole number of {POSITION_BYTES}-byte positions")
+        records = np.frombuffer(data, dtype=np.uint8).reshape(-1, POSITION_BYTES)
+        return records[:, :NUM_SQUARES], records[:, NUM_SQUARES].astype(bool)
+    positions = [Position.from_fen(line) for line in data.decode().splitlines() if line.strip()]
+    return squares_array(positions), np.array([position.turn == 'black' for position in positions], dtype=bool)
+
+
+def write_position_file(path, positions):
+    with open(path, 'wb') as position_file:
+        for position in positions:
+            position_file.write(position.to_bytes())
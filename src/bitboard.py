@@ -0,0 +1,389 @@
+from .piece import Pawn, Rook, Knight, Bishop, Queen, King
+
+# Board geometry: square index = y * WIDTH + x, so a1 is bit 0 and e6 is bit 29
+WIDTH = 5
+HEIGHT = 6
+NUM_SQUARES = WIDTH * HEIGHT
+FULL_MASK = (1 << NUM_SQUARES) - 1
+
+# Piece type indexes into the per-color mask lists
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+WHITE, BLACK = 0, 1
+
+COLOR_NAMES = ('white', 'black')
+COLOR_INDEX = {'white': WHITE, 'black': BLACK}
+PIECE_INDEX = {Pawn: PAWN, Knight: KNIGHT, Bishop: BISHOP, Rook: ROOK, Queen: QUEEN, King: KING}
+PIECE_CLASSES = (Pawn, Knight, Bishop, Rook, Queen, King)
+
+# Ray directions; the first four increase the square index, the last four decrease it
+ROOK_DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+BISHOP_DIRECTIONS = [(1, 1), (-1, 1), (1, -1), (-1, -1)]
+POSITIVE_DIRECTIONS = [(0, 1), (1, 0), (1, 1), (-1, 1)]
+NEGATIVE_DIRECTIONS = [(0, -1), (-1, 0), (1, -1), (-1, -1)]
+
+
+def square_index(position):
+    """Convert an (x, y) board position to a square index."""
+    x, y = position
+    return y * WIDTH + x
+
+
+def square_position(square):
+    """Convert a square index to an (x, y) board position."""
+    return (square % WIDTH, square // WIDTH)
+
+
+def _offset_table(offsets):
+    """Precompute the attack mask of a leaper for every square."""
+    table = []
+    for square in range(NUM_SQUARES):
+        x, y = square_position(square)
+        mask = 0
+        for dx, dy in offsets:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < WIDTH and 0 <= ny < HEIGHT:
+                mask |= 1 << (ny * WIDTH + nx)
+        table.append(mask)
+    return table
+
+
+def _ray_table(direction):
+    """Precompute the empty-board ray in one direction for every square."""
+    dx, dy = direction
+    table = []
+    for square in range(NUM_SQUARES):
+        x, y = square_position(square)
+        mask = 0
+        x, y = x + dx, y + dy
+        while 0 <= x < WIDTH and 0 <= y < HEIGHT:
+            mask |= 1 << (y * WIDTH + x)
+            x, y = x + dx, y + dy
+        table.append(mask)
+    return table
+
+
+KNIGHT_ATTACKS = _offset_table([
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+])
+KING_ATTACKS = _offset_table(ROOK_DIRECTIONS + BISHOP_DIRECTIONS)
+PAWN_ATTACKS = (_offset_table([(-1, 1), (1, 1)]), _offset_table([(-1, -1), (1, -1)]))
+PAWN_PUSHES = (_offset_table([(0, 1)]), _offset_table([(0, -1)]))
+POSITIVE_RAYS = [_ray_table(direction) for direction in POSITIVE_DIRECTIONS]
+NEGATIVE_RAYS = [_ray_table(direction) for direction in NEGATIVE_DIRECTIONS]
+
+# Ray indexes for rook-like (orthogonal) and bishop-like (diagonal) sliders
+ROOK_RAYS = ((0, 1), (0, 1))
+BISHOP_RAYS = ((2, 3), (2, 3))
+
+
+def _slide(square, occupied, positive, negative):
+    """Attack mask of a slider along the given ray indexes."""
+    attacks = 0
+    for ray in positive:
+        mask = POSITIVE_RAYS[ray][square]
+        blockers = mask & occupied
+        if blockers:
+            first = (blockers & -blockers).bit_length() - 1
+            mask ^= POSITIVE_RAYS[ray][first]
+        attacks |= mask
+    for ray in negative:
+        mask = NEGATIVE_RAYS[ray][square]
+        blockers = mask & occupied
+        if blockers:
+            first = blockers.bit_length() - 1
+            mask ^= NEGATIVE_RAYS[ray][first]
+        attacks |= mask
+    return attacks
+
+
+def rook_attacks(square, occupied):
+    return _slide(square, occupied, ROOK_RAYS[0], ROOK_RAYS[1])
+
+
+def bishop_attacks(square, occupied):
+    return _slide(square, occupied, BISHOP_RAYS[0], BISHOP_RAYS[1])
+
+
+def iter_bits(mask):
+    """Yield the square index of every set bit, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _between_table():
+    """Squares strictly between two squares on a shared line, for every pair (0 if not on one)."""
+    table = [[0] * NUM_SQUARES for _ in range(NUM_SQUARES)]
+    for rays in POSITIVE_RAYS + NEGATIVE_RAYS:
+        for square in range(NUM_SQUARES):
+            for other in iter_bits(rays[square]):
+                table[square][other] = rays[square] ^ rays[other] ^ (1 << other)
+    return table
+
+
+BETWEEN = _between_table()
+# (rays, runs towards higher squares, orthogonal) for each of the eight directions from a square
+DIRECTION_RAYS = ([(POSITIVE_RAYS[ray], True, ray < 2) for ray in range(4)]
+                  + [(NEGATIVE_RAYS[ray], False, ray < 2) for ray in range(4)])
+
+
+class BitBoard:
+    """Bitboard engine for the 5x6 board.
+
+    Every piece set is a 30-bit int: one mask per color and piece type plus
+    an occupancy mask per color. It is a move generation and check
+    detection engine for perft, the movegen benchmark and the tablebase
+    generator, not a drop-in Board: make_move and generate_legal_moves
+    work on square indexes and there is no hashing, evaluation or game
+    status. get_legal_moves, get_possible_moves, is_in_check,
+    is_checkmate and is_stalemate answer in Board's terms, with
+    ((x, y), (x, y)) moves, so the two engines can be checked against
+    each other.
+    """
+
+    def __init__(self):
+        self.pieces = [[0] * 6, [0] * 6]
+        self.occupied = [0, 0]
+        self.current_turn = 'white'
+        self.move_history = []
+        self.initialize_board()
+
+    def initialize_board(self):
+        piece_order = [ROOK, KNIGHT, BISHOP, QUEEN, KING]
+        for x, piece_type in enumerate(piece_order):
+            self.put_piece(WHITE, piece_type, square_index((x, 0)))
+            self.put_piece(BLACK, piece_type, square_index((x, 5)))
+        for x in range(WIDTH):
+            self.put_piece(WHITE, PAWN, square_index((x, 1)))
+            self.put_piece(BLACK, PAWN, square_index((x, 4)))
+
+    @classmethod
+    def from_board(cls, board):
+        """Build a bitboard from an object-based Board."""
+        bitboard = cls.__new__(cls)
+        bitboard.pieces = [[0] * 6, [0] * 6]
+        bitboard.occupied = [0, 0]
+        bitboard.current_turn = board.current_turn
+        bitboard.move_history = []
+        for y in range(HEIGHT):
+            for x in range(WIDTH):
+                piece = board.board[y][x]
+                if piece:
+                    bitboard.put_piece(COLOR_INDEX[piece.color], PIECE_INDEX[type(piece)], y * WIDTH + x)
+        return bitboard
+
+    def put_piece(self, color, piece_type, square):
+        bit = 1 << square
+        self.pieces[color][piece_type] |= bit
+        self.occupied[color] |= bit
+
+    def remove_piece(self, color, piece_type, square):
+        bit = 1 << square
+        self.pieces[color][piece_type] &= ~bit
+        self.occupied[color] &= ~bit
+
+    def piece_at(self, square):
+        """Return (color, piece_type) of the piece on a square, or None."""
+        bit = 1 << square
+        for color in (WHITE, BLACK):
+            if self.occupied[color] & bit:
+                masks = self.pieces[color]
+                for piece_type in range(6):
+                    if masks[piece_type] & bit:
+                        return color, piece_type
+        return None
+
+    def get_piece_type(self, position):
+        """Return the piece class and color name at (x, y), or None."""
+        found = self.piece_at(square_index(position))
+        if found is None:
+            return None
+        color, piece_type = found
+        return PIECE_CLASSES[piece_type], COLOR_NAMES[color]
+
+    def attacks_from(self, color, piece_type, square, occupied):
+        """Squares attacked by a piece standing on the given square."""
+        if piece_type == PAWN:
+            return PAWN_ATTACKS[color][square]
+        if piece_type == KNIGHT:
+            return KNIGHT_ATTACKS[square]
+        if piece_type == KING:
+            return KING_ATTACKS[square]
+        if piece_type == ROOK:
+            return rook_attacks(square, occupied)
+        if piece_type == BISHOP:
+            return bishop_attacks(square, occupied)
+        return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+
+    def is_square_attacked(self, square, by_color, occupied=None):
+        """Check whether by_color attacks the square, looking outward from it.
+
+        occupied overrides the occupancy sliders are blocked by, e.g. to
+        see through a king that is about to step away.
+        """
+        masks = self.pieces[by_color]
+        if KNIGHT_ATTACKS[square] & masks[KNIGHT]:
+            return True
+        if KING_ATTACKS[square] & masks[KING]:
+            return True
+        # A pawn of by_color attacks this square if it stands where our pawn would capture
+        if PAWN_ATTACKS[1 - by_color][square] & masks[PAWN]:
+            return True
+        if occupied is None:
+            occupied = self.occupied[WHITE] | self.occupied[BLACK]
+        if rook_attacks(square, occupied) & (masks[ROOK] | masks[QUEEN]):
+            return True
+        if bishop_attacks(square, occupied) & (masks[BISHOP] | masks[QUEEN]):
+            return True
+        return False
+
+    def is_in_check(self, color):
+        """Determine if the specified color's king is in check."""
+        color = COLOR_INDEX[color]
+        king = self.pieces[color][KING]
+        if not king:
+            return False
+        return self.is_square_attacked(king.bit_length() - 1, 1 - color)
+
+    def generate_pseudo_moves(self, color):
+        """Generate (start_square, end_square) pairs ignoring check."""
+        moves = []
+        own = self.occupied[color]
+        enemy = self.occupied[1 - color]
+        occupied = own | enemy
+        masks = self.pieces[color]
+        for piece_type in range(6):
+            for square in iter_bits(masks[piece_type]):
+                if piece_type == PAWN:
+                    targets = (PAWN_PUSHES[color][square] & ~occupied) | (PAWN_ATTACKS[color][square] & enemy)
+                else:
+                    targets = self.attacks_from(color, piece_type, square, occupied) & ~own
+                for target in iter_bits(targets):
+                    moves.append((square, target))
+        return moves
+
+    def make_move(self, start, end):
+        """Make a move between square indexes without validation."""
+        color = COLOR_INDEX[self.current_turn]
+        _, piece_type = self.piece_at(start)
+        captured = self.piece_at(end)
+        if captured:
+            self.remove_piece(captured[0], captured[1], end)
+        self.remove_piece(color, piece_type, start)
+        self.put_piece(color, piece_type, end)
+        self.move_history.append((start, end, piece_type, captured))
+        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+
+    def unmake_move(self):
+        """Take back the last move made with make_move."""
+        start, end, piece_type, captured = self.move_history.pop()
+        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+        color = COLOR_INDEX[self.current_turn]
+        self.remove_piece(color, piece_type, end)
+        self.put_piece(color, piece_type, start)
+        if captured:
+            self.put_piece(captured[0], captured[1], end)
+
+    def pinned_pieces(self, color, king, occupied):
+        """Map the square of each piece of color pinned to its king to the squares it may still move to."""
+        own = self.occupied[color]
+        enemy_masks = self.pieces[1 - color]
+        orthogonal = enemy_masks[ROOK] | enemy_masks[QUEEN]
+        diagonal = enemy_masks[BISHOP] | enemy_masks[QUEEN]
+        pinned = {}
+        for rays, positive, straight in DIRECTION_RAYS:
+            ray = rays[king]
+            blockers = ray & occupied
+            if not blockers:
+                continue
+            first = (blockers & -blockers).bit_length() - 1 if positive else blockers.bit_length() - 1
+            if not own >> first & 1:
+                continue
+            beyond = blockers & rays[first]
+            if not beyond:
+                continue
+            second = (beyond & -beyond).bit_length() - 1 if positive else beyond.bit_length() - 1
+            if (orthogonal if straight else diagonal) >> second & 1:
+                # Along the line up to and including the pinning piece
+                pinned[first] = ray ^ rays[second]
+        return pinned
+
+    def generate_legal_moves(self, color):
+        """Generate legal (start_square, end_square) pairs for a color name.
+
+        Legality comes from the attack tables rather than trying each
+        move: in double check only the king moves, in single check other
+        pieces must capture the checker or block its line, and a pinned
+        piece stays on the line to its pinner.
+        """
+        color = COLOR_INDEX[color]
+        enemy_color = 1 - color
+        masks = self.pieces[color]
+        king_mask = masks[KING]
+        if not king_mask:
+            return self.generate_pseudo_moves(color)
+        king = king_mask.bit_length() - 1
+        own = self.occupied[color]
+        enemy = self.occupied[enemy_color]
+        occupied = own | enemy
+        enemy_masks = self.pieces[enemy_color]
+        checkers = ((KNIGHT_ATTACKS[king] & enemy_masks[KNIGHT])
+                    | (KING_ATTACKS[king] & enemy_masks[KING])
+                    | (PAWN_ATTACKS[color][king] & enemy_masks[PAWN])
+                    | (rook_attacks(king, occupied) & (enemy_masks[ROOK] | enemy_masks[QUEEN]))
+                    | (bishop_attacks(king, occupied) & (enemy_masks[BISHOP] | enemy_masks[QUEEN])))
+
+        legal = []
+        if not checkers & (checkers - 1):
+            if checkers:
+                checker = checkers.bit_length() - 1
+                allowed = checkers | BETWEEN[king][checker]
+            else:
+                allowed = FULL_MASK
+            pinned = self.pinned_pieces(color, king, occupied)
+            for piece_type in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN):
+                for square in iter_bits(masks[piece_type]):
+                    if piece_type == PAWN:
+                        targets = (PAWN_PUSHES[color][square] & ~occupied) | (PAWN_ATTACKS[color][square] & enemy)
+                    else:
+                        targets = self.attacks_from(color, piece_type, square, occupied) & ~own
+                    targets &= allowed
+                    if square in pinned:
+                        targets &= pinned[square]
+                    for target in iter_bits(targets):
+                        legal.append((square, target))
+
+        # The king may not stay on a checking slider's line, so look through it
+        without_king = occupied ^ king_mask
+        for target in iter_bits(KING_ATTACKS[king] & ~own):
+            if not self.is_square_attacked(target, enemy_color, without_king):
+                legal.append((king, target))
+        return legal
+
+    def get_legal_moves(self, color, captures_only=False):
+        """Legal moves (or only captures) as ((x, y), (x, y)) tuples, like Board.get_legal_moves."""
+        moves = self.generate_legal_moves(color)
+        if captures_only:
+            enemy = self.occupied[1 - COLOR_INDEX[color]]
+            moves = [(start, end) for start, end in moves if enemy >> end & 1]
+        return [(square_position(start), square_position(end)) for start, end in moves]
+
+    def get_possible_moves(self, position):
+        """Legal destinations for the piece at (x, y), like Piece.get_possible_moves."""
+        found = self.piece_at(square_index(position))
+        if found is None:
+            return []
+        start = square_index(position)
+        return [square_position(end)
+                for move_start, end in self.generate_legal_moves(COLOR_NAMES[found[0]])
+                if move_start == start]
+
+    def is_checkmate(self, color):
+        """Determine if the specified color is in checkmate."""
+        return self.is_in_check(color) and not self.generate_legal_moves(color)
+
+    def is_stalemate(self, color):
+        """Determine if the specified color is in stalemate."""
+        return not self.is_in_check(color) and not self.generate_legal_moves(color)
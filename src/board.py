@@ -1,4 +1,40 @@
 from .piece import Piece, Pawn, Rook, Knight, Bishop, Queen, King
+from . import zobrist
+from . import evaluation
+from .position import Position
+
+ORTHOGONAL_DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+DIAGONAL_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+KNIGHT_OFFSETS = [
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+]
+
+CHECKMATE = 'checkmate'
+STALEMATE = 'stalemate'
+
+
+class GameStatus:
+    """Everything callers need to know about the side to move in one position."""
+    __slots__ = ('turn', 'in_check', 'legal_moves', 'result')
+
+    def __init__(self, turn, in_check, legal_moves):
+        self.turn = turn
+        self.in_check = in_check
+        self.legal_moves = legal_moves
+        if legal_moves:
+            self.result = None
+        else:
+            self.result = CHECKMATE if in_check else STALEMATE
+
+    @property
+    def legal_move_count(self):
+        return len(self.legal_moves)
+
+    @property
+    def is_over(self):
+        return self.result is not None
+
 
 class Board:
     def __init__(self):
@@ -6,6 +42,10 @@ class Board:
         self.move_history = []
         self.current_turn = 'white'
         self.initialize_board()
+        self._zobrist_key = zobrist.compute_key(self)
+        self._eval_score = evaluation.compute_score(self)
+        self.index_pieces()
+        self._status = None
 
 
     def initialize_board(self):
@@ -20,6 +60,69 @@ class Board:
             self.board[0][x] = piece('white', (x, 0))
             self.board[5][x] = piece('black', (x, 5))
 
+    @classmethod
+    def from_position(cls, position):
+        """Create a board set up from a Position snapshot."""
+        board = cls()
+        board.set_position(position)
+        return board
+
+    @classmethod
+    def from_fen(cls, fen):
+        """Create a board from a FEN-style string (see Position.from_fen)."""
+        return cls.from_position(Position.from_fen(fen))
+
+    def to_fen(self):
+        return self.to_position().to_fen()
+
+    def to_position(self):
+        """Take a compact Position snapshot of the board."""
+        return Position.from_board(self)
+
+    def set_position(self, position):
+        """Replace the board contents with a Position, clearing the move history."""
+        self.board = [[None] * 5 for _ in range(6)]
+        for piece_type, color, (x, y) in position.pieces():
+            piece = piece_type(color, (x, y))
+            piece.has_moved = bool(position.moved >> (y * 5 + x) & 1)
+            self.board[y][x] = piece
+        self.current_turn = position.turn
+        self.move_history = []
+        self._zobrist_key = zobrist.compute_key(self)
+        self._eval_score = evaluation.compute_score(self)
+        self.index_pieces()
+        self._status = None
+
+    def copy(self):
+        """Return an independent board with the same position (no move history)."""
+        return Board.from_position(self.to_position())
+
+    def index_pieces(self):
+        """Rebuild the per-color piece lists and king squares from the grid.
+
+        Moves keep both up to date incrementally; this full scan is only
+        needed after the grid has been set up directly.
+        """
+        self.piece_lists = {'white': [], 'black': []}
+        self.king_positions = {}
+        for y in range(6):
+            for x in range(5):
+                piece = self.board[y][x]
+                if piece:
+                    self.piece_lists[piece.color].append(piece)
+                    if isinstance(piece, King):
+                        self.king_positions[piece.color] = (x, y)
+
+    @property
+    def zobrist_key(self):
+        """64-bit Zobrist key of the current position, including side to move."""
+        return self._zobrist_key
+
+    @property
+    def eval_score(self):
+        """Material plus piece-square score from white's point of view, kept up to date by moves."""
+        return self._eval_score
+
     def get_piece(self, position):
         """Get piece at the specified position."""
         x, y = position
@@ -38,18 +141,11 @@ class Board:
 
     def get_all_pieces(self, color):
         """Get all pieces of specified color."""
-        pieces = []
-        for y in range(6):
-            for x in range(5):
-                piece = self.board[y][x]
-                if piece and piece.color == color:
-                    pieces.append((piece, (x, y)))
-        return pieces
+        return [(piece, piece.position) for piece in self.piece_lists[color]]
 
     def move_piece(self, start_pos, end_pos):
         """Move a piece with full validation and game rules."""
         start_x, start_y = start_pos
-        end_x, end_y = end_pos
         
         # Basic validation
         if not (self.is_position_valid(start_pos) and self.is_position_valid(end_pos)):
@@ -61,80 +157,167 @@ class Board:
         if not piece or piece.color != self.current_turn:
             return False
             
-        # Check if move is valid for the piece
-        if not piece.is_valid_move(self, end_pos):
-            return False
-            
-        # Check if move would put/leave king in check
-        if self.would_be_in_check(piece.color, start_pos, end_pos):
+        # Check if move is legal (this includes king safety)
+        if (start_pos, end_pos) not in self.get_status().legal_moves:
             return False
             
-        # Capture piece if present
+        self.make_move(start_pos, end_pos)
+        return True
+
+    def make_move(self, start_pos, end_pos):
+        """Make a move in place without validation and return its record.
+
+        Used by the search, which only plays moves it has already generated
+        as legal. Every change is recorded so unmake_move can restore it.
+        """
+        start_x, start_y = start_pos
+        end_x, end_y = end_pos
+        piece = self.board[start_y][start_x]
         captured_piece = self.board[end_y][end_x]
-        
+
         # Make the move
         self.board[end_y][end_x] = piece
         self.board[start_y][start_x] = None
-        piece.position = end_pos
-        piece.has_moved = True
-        
-        # Record the move
-        self.move_history.append({
+        keys = zobrist.PIECE_KEYS[type(piece)][piece.color]
+        key = self._zobrist_key ^ keys[start_y * 5 + start_x] ^ keys[end_y * 5 + end_x] ^ zobrist.BLACK_TO_MOVE
+        scores = evaluation.SQUARE_SCORES[type(piece)][piece.color]
+        score = self._eval_score - scores[start_y * 5 + start_x] + scores[end_y * 5 + end_x]
+        captured_index = None
+        if captured_piece:
+            key ^= zobrist.piece_key(captured_piece, end_pos)
+            score -= evaluation.piece_score(captured_piece, end_pos)
+            captured_list = self.piece_lists[captured_piece.color]
+            captured_index = captured_list.index(captured_piece)
+            del captured_list[captured_index]
+        self._zobrist_key = key
+        self._eval_score = score
+        move = {
             'piece': piece,
             'start': start_pos,
             'end': end_pos,
-            'captured': captured_piece
-        })
-        
+            'captured': captured_piece,
+            'captured_index': captured_index,
+            'had_moved': piece.has_moved
+        }
+        piece.position = end_pos
+        piece.has_moved = True
+        if isinstance(piece, King):
+            self.king_positions[piece.color] = end_pos
+
+        # Record the move
+        self.move_history.append(move)
+
         # Switch turns
         self.current_turn = 'black' if self.current_turn == 'white' else 'white'
-        
-        return True
 
-    def undo_last_move(self):
-        """Undo the last move made."""
-        if not self.move_history:
-            return False
+        return move
 
-        last_move = self.move_history.pop()
-        piece, start_pos, end_pos, captured_piece = (
-            last_move['piece'],
-            last_move['start'],
-            last_move['end'],
-            last_move['captured'],
-        )
+    def unmake_move(self):
+        """Take back the last move, restoring the captured piece, has_moved and turn."""
+        move = self.move_history.pop()
+        piece, start_pos, end_pos = move['piece'], move['start'], move['end']
 
         # Restore piece to original position
-        self.board[start_pos[1]][start_pos[0]], self.board[end_pos[1]][end_pos[0]] = piece, captured_piece
+        captured_piece = move['captured']
+        self.board[start_pos[1]][start_pos[0]] = piece
+        self.board[end_pos[1]][end_pos[0]] = captured_piece
         piece.position = start_pos
+        piece.has_moved = move['had_moved']
+        if isinstance(piece, King):
+            self.king_positions[piece.color] = start_pos
+
+        key = self._zobrist_key ^ zobrist.piece_key(piece, start_pos) ^ zobrist.piece_key(piece, end_pos)
+        score = self._eval_score + evaluation.piece_score(piece, start_pos) - evaluation.piece_score(piece, end_pos)
+        if captured_piece:
+            key ^= zobrist.piece_key(captured_piece, end_pos)
+            score += evaluation.piece_score(captured_piece, end_pos)
+            self.piece_lists[captured_piece.color].insert(move['captured_index'], captured_piece)
+        self._zobrist_key = key ^ zobrist.BLACK_TO_MOVE
+        self._eval_score = score
 
         # Switch turns back
         self.current_turn = 'black' if self.current_turn == 'white' else 'white'
 
+        return move
+
+    def make_null_move(self):
+        """Pass the turn without moving, for null-move pruning in the search.
+
+        Recorded as None in the move history; take it back with
+        unmake_null_move.
+        """
+        self.move_history.append(None)
+        self._zobrist_key ^= zobrist.BLACK_TO_MOVE
+        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+
+    def unmake_null_move(self):
+        self.move_history.pop()
+        self._zobrist_key ^= zobrist.BLACK_TO_MOVE
+        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+
+    def has_non_pawn_material(self, color):
+        """Whether color has any piece besides its king and pawns."""
+        for piece in self.piece_lists[color]:
+            if not isinstance(piece, (Pawn, King)):
+                return True
+        return False
+
+    def undo_last_move(self):
+        """Undo the last move made."""
+        if not self.move_history:
+            return False
+
+        self.unmake_move()
         return True
 
+    def is_square_attacked(self, square, by_color):
+        """Check whether any piece of by_color attacks the square.
+
+        Looks outward from the square along rook and bishop rays and the
+        knight, king and pawn offsets instead of generating every move.
+        """
+        x, y = square
+        board = self.board
+
+        for dx, dy in KNIGHT_OFFSETS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < 5 and 0 <= ny < 6:
+                target = board[ny][nx]
+                if target and target.color == by_color and isinstance(target, Knight):
+                    return True
+
+        # Pawns of by_color capture towards the square from one row behind it
+        pawn_y = y - 1 if by_color == 'white' else y + 1
+        if 0 <= pawn_y < 6:
+            for nx in (x - 1, x + 1):
+                if 0 <= nx < 5:
+                    target = board[pawn_y][nx]
+                    if target and target.color == by_color and isinstance(target, Pawn):
+                        return True
+
+        for directions, sliders in ((ORTHOGONAL_DIRECTIONS, (Rook, Queen)),
+                                    (DIAGONAL_DIRECTIONS, (Bishop, Queen))):
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                distance = 1
+                while 0 <= nx < 5 and 0 <= ny < 6:
+                    target = board[ny][nx]
+                    if target:
+                        if target.color == by_color and (
+                                isinstance(target, sliders) or (distance == 1 and isinstance(target, King))):
+                            return True
+                        break
+                    nx, ny = nx + dx, ny + dy
+                    distance += 1
+        return False
+
     def is_in_check(self, color):
         """Determine if the specified color's king is in check."""
-        # Find king position
-        king_pos = None
-        for y in range(6):
-            for x in range(5):
-                piece = self.board[y][x]
-                if isinstance(piece, King) and piece.color == color:
-                    king_pos = (x, y)
-                    break
-            if king_pos:
-                break
-
+        king_pos = self.king_positions.get(color)
         if not king_pos:
             return False  # Should not happen in a valid game
-
-        # Check if any opponent piece can capture the king
         opponent_color = 'black' if color == 'white' else 'white'
-        for piece, pos in self.get_all_pieces(opponent_color):
-            if king_pos in piece.get_possible_moves(self, ignore_check=True):
-                return True
-        return False
+        return self.is_square_attacked(king_pos, opponent_color)
 
     def would_be_in_check(self, color, start_pos, end_pos):
         """Check if making a move would result in check."""
@@ -145,11 +328,21 @@ class Board:
         moving_piece = self.board[start_y][start_x]
         captured_piece = self.board[end_y][end_x]
         
-        # Make temporary move
+        # Make temporary move, keeping the position key in step
+        saved_key = self._zobrist_key
+        key = saved_key
+        if moving_piece:
+            key ^= zobrist.piece_key(moving_piece, start_pos) ^ zobrist.piece_key(moving_piece, end_pos)
+        if captured_piece:
+            key ^= zobrist.piece_key(captured_piece, end_pos)
         self.board[end_y][end_x] = moving_piece
         self.board[start_y][start_x] = None
+        self._zobrist_key = key
+        moving_king = isinstance(moving_piece, King)
         if moving_piece:
             moving_piece.position = end_pos
+        if moving_king:
+            self.king_positions[moving_piece.color] = end_pos
         
         # Check if king is in check
         in_check = self.is_in_check(color)
@@ -157,49 +350,144 @@ class Board:
         # Restore board
         self.board[start_y][start_x] = moving_piece
         self.board[end_y][end_x] = captured_piece
+        self._zobrist_key = saved_key
         if moving_piece:
             moving_piece.position = start_pos
+        if moving_king:
+            self.king_positions[moving_piece.color] = start_pos
         
         return in_check
 
+    def get_check_info(self, color):
+        """Find what is checking color's king and which of its pieces are pinned.
+
+        Returns (evasions, pins). evasions is None when the king is not in
+        check, otherwise the set of squares a non-king move must land on
+        (empty in double check). pins maps the position of each pinned piece
+        to the squares along its pin line it may still move to.
+        """
+        king_pos = self.king_positions.get(color)
+        if king_pos is None:
+            return None, {}
+
+        king_x, king_y = king_pos
+        checks = []
+        pins = {}
+
+        # Sliders: walk each ray out from the king
+        for dx, dy in ORTHOGONAL_DIRECTIONS + DIAGONAL_DIRECTIONS:
+            sliders = (Rook, Queen) if dx == 0 or dy == 0 else (Bishop, Queen)
+            line = []
+            blocker = None
+            x, y = king_x + dx, king_y + dy
+            while 0 <= x < 5 and 0 <= y < 6:
+                line.append((x, y))
+                target = self.board[y][x]
+                if target:
+                    if target.color == color:
+                        if blocker:
+                            break
+                        blocker = (x, y)
+                    else:
+                        if isinstance(target, sliders):
+                            if blocker:
+                                pins[blocker] = set(line)
+                            else:
+                                checks.append(set(line))
+                        break
+                x, y = x + dx, y + dy
+
+        # Knights and pawns can only check from fixed offsets
+        for dx, dy in KNIGHT_OFFSETS:
+            x, y = king_x + dx, king_y + dy
+            if 0 <= x < 5 and 0 <= y < 6:
+                target = self.board[y][x]
+                if isinstance(target, Knight) and target.color != color:
+                    checks.append({(x, y)})
+        pawn_y = king_y + (1 if color == 'white' else -1)
+        for dx in (-1, 1):
+            x = king_x + dx
+            if 0 <= x < 5 and 0 <= pawn_y < 6:
+                target = self.board[pawn_y][x]
+                if isinstance(target, Pawn) and target.color != color:
+                    checks.append({(x, pawn_y)})
+
+        if not checks:
+            return None, pins
+        if len(checks) > 1:
+            return set(), pins
+        return checks[0], pins
+
+    def get_legal_targets(self, piece, check_info, captures_only=False):
+        """Legal destination squares for one piece, given get_check_info for its color."""
+        position = piece.position
+        moves = piece.generate_moves(self)
+        if captures_only:
+            moves = [move for move in moves if self.board[move[1]][move[0]] is not None]
+        if isinstance(piece, King):
+            # Lift the king so sliders attack straight through its old square
+            x, y = position
+            opponent_color = 'black' if piece.color == 'white' else 'white'
+            self.board[y][x] = None
+            moves = [move for move in moves if not self.is_square_attacked(move, opponent_color)]
+            self.board[y][x] = piece
+            return moves
+
+        evasions, pins = check_info
+        if evasions is not None:
+            moves = [move for move in moves if move in evasions]
+        pin_line = pins.get(position)
+        if pin_line is not None:
+            moves = [move for move in moves if move in pin_line]
+        return moves
+
+    def get_legal_moves(self, color, captures_only=False):
+        """Generate all legal moves (or only captures) for a color as (start, end) pairs."""
+        check_info = self.get_check_info(color)
+        moves = []
+        for piece, pos in self.get_all_pieces(color):
+            for move in self.get_legal_targets(piece, check_info, captures_only):
+                moves.append((pos, move))
+        return moves
+
+    def get_status(self):
+        """Check flag, legal moves and result for the side to move.
+
+        Computed in a single pass and cached against the position key, so
+        it is recomputed only after a move or undo changes the position.
+        """
+        status = self._status
+        if status is None or status[0] != self._zobrist_key:
+            turn = self.current_turn
+            status = (self._zobrist_key, GameStatus(turn, self.is_in_check(turn), tuple(self.get_legal_moves(turn))))
+            self._status = status
+        return status[1]
+
     def is_checkmate(self, color):
         """Determine if the specified color is in checkmate."""
-        if not self.is_in_check(color):
-            return False
-            
-        # Check all possible moves for all pieces
-        for piece, pos in self.get_all_pieces(color):
-            for move in piece.get_possible_moves(self):
-                if not self.would_be_in_check(color, pos, move):
-                    return False
-        return True
+        if color == self.current_turn:
+            return self.get_status().result == CHECKMATE
+        return self.is_in_check(color) and not self.get_legal_moves(color)
 
     def is_stalemate(self, color):
         """Determine if the specified color is in stalemate."""
-        if self.is_in_check(color):
-            return False
-            
-        # Check if any legal moves are available
-        for piece, pos in self.get_all_pieces(color):
-            for move in piece.get_possible_moves(self):
-                if not self.would_be_in_check(color, pos, move):
-                    return False
-        return True
+        if color == self.current_turn:
+            return self.get_status().result == STALEMATE
+        return not self.is_in_check(color) and not self.get_legal_moves(color)
 
     def get_game_state(self):
         """Get the current state of the game."""
-        if self.is_checkmate('white'):
-            return 'Black wins by checkmate'
-        elif self.is_checkmate('black'):
-            return 'White wins by checkmate'
-        elif self.is_stalemate('white') or self.is_stalemate('black'):
+        status = self.get_status()
+        turn = status.turn.capitalize()
+        if status.result == CHECKMATE:
+            winner = 'Black' if status.turn == 'white' else 'White'
+            return f'{winner} wins by checkmate'
+        elif status.result == STALEMATE:
             return 'Draw by stalemate'
-        elif self.is_in_check('white'):
-            return 'White is in check'
-        elif self.is_in_check('black'):
-            return 'Black is in check'
+        elif status.in_check:
+            return f'{turn} is in check'
         else:
-            return f"{self.current_turn.capitalize()}'s turn"
+            return f"{turn}'s turn"
 
     def display(self):
         """Display the current state of the board."""
@@ -0,0 +1,98 @@
+from .piece import Pawn, Rook, Knight, Bishop, Queen, King
+
+PIECE_VALUES = {
+    Pawn: 100,
+    Knight: 320,
+    Bishop: 330,
+    Rook: 500,
+    Queen: 900,
+    King: 20000
+}
+
+# Positional bonus of each piece type for white, one row per rank from
+# rank 1 (a1-e1) up to rank 6. Black uses the same tables mirrored.
+PIECE_SQUARE_TABLES = {
+    # Pawns cannot promote, so one that reaches the last rank is stuck for good
+    Pawn: [
+         0,   0,   0,   0,   0,
+         0,   0,   0,   0,   0,
+         5,  15,  25,  15,   5,
+        15,  25,  35,  25,  15,
+        20,  30,  40,  30,  20,
+       -20, -20, -20, -20, -20,
+    ],
+    Knight: [
+       -40, -25, -20, -25, -40,
+       -25,   0,  10,   0, -25,
+       -20,  15,  25,  15, -20,
+       -20,  15,  25,  15, -20,
+       -25,   0,  10,   0, -25,
+       -40, -25, -20, -25, -40,
+    ],
+    Bishop: [
+       -15, -10, -10, -10, -15,
+       -10,   5,   5,   5, -10,
+       -10,  10,  15,  10, -10,
+       -10,  10,  15,  10, -10,
+       -10,   5,   5,   5, -10,
+       -15, -10, -10, -10, -15,
+    ],
+    Rook: [
+         0,   5,  10,   5,   0,
+        -5,   0,   0,   0,  -5,
+        -5,   0,   0,   0,  -5,
+        -5,   0,   0,   0,  -5,
+        15,  20,  20,  20,  15,
+         5,   5,   5,   5,   5,
+    ],
+    Queen: [
+       -10,  -5,  -5,  -5, -10,
+        -5,   0,   5,   0,  -5,
+        -5,   5,  10,   5,  -5,
+        -5,   5,  10,   5,  -5,
+        -5,   0,   5,   0,  -5,
+       -10,  -5,  -5,  -5, -10,
+    ],
+    # With so few pieces on the board the king is safest at home
+    King: [
+        10,  20,   5,  20,  10,
+        -5, -10, -15, -10,  -5,
+       -20, -25, -30, -25, -20,
+       -30, -35, -40, -35, -30,
+       -40, -45, -50, -45, -40,
+       -50, -55, -60, -55, -50,
+    ],
+}
+
+
+def _square_scores(piece_type, color):
+    """Material plus positional score on every square, positive for white."""
+    table = PIECE_SQUARE_TABLES[piece_type]
+    value = PIECE_VALUES[piece_type]
+    if color == 'white':
+        return [value + bonus for bonus in table]
+    return [-(value + table[(5 - square // 5) * 5 + square % 5]) for square in range(30)]
+
+
+# SQUARE_SCORES[piece class][color][y * 5 + x], from white's point of view
+SQUARE_SCORES = {
+    piece_type: {color: _square_scores(piece_type, color) for color in ('white', 'black')}
+    for piece_type in PIECE_SQUARE_TABLES
+}
+
+
+def piece_score(piece, position):
+    """Score of one piece standing on (x, y), from white's point of view."""
+    x, y = position
+    return SQUARE_SCORES[type(piece)][piece.color][y * 5 + x]
+
+
+def compute_score(board):
+    """Compute the material and piece-square score of a board from scratch."""
+    score = 0
+    for y in range(6):
+        for x in range(5):
+            piece = board.board[y][x]
+            if piece:
+                score += SQUARE_SCORES[type(piece)][piece.color][y * 5 + x]
+    return score
@@ -1,9 +1,12 @@
-from .board import Board
+from .board import Board, CHECKMATE, STALEMATE
 from .ai import MinichessAI
+from .opening_book import default_book_path
+from .tablebase import default_tablebase_dir
+from .ponder import Ponderer
 import time
 
 class MinichessGame:
-    def __init__(self, player1_type='human', player2_type='ai', player1_depth=3, player2_depth=3):
+    def __init__(self, player1_type='human', player2_type='ai', player1_depth=3, player2_depth=3, ponder=True):
         self.board = Board()
         self.current_player = 'white'
         self.game_running = True
@@ -12,11 +15,18 @@ class MinichessGame:
             'white': self.create_player(player1_type, 'white', player1_depth),
             'black': self.create_player(player2_type, 'black', player2_depth)
         }
+        # AI players facing a human search the expected position while the human thinks
+        self.ponderers = {}
+        if ponder:
+            for color, opponent in (('white', 'black'), ('black', 'white')):
+                if self.players[color] and not self.players[opponent]:
+                    self.ponderers[color] = Ponderer(self.players[color])
 
     def create_player(self, player_type, color, depth):
         if player_type.lower() == 'human':
             return None
-        return MinichessAI(color, depth)
+        return MinichessAI(color, depth, book_path=default_book_path(),
+                           tablebase_dir=default_tablebase_dir())
 
     def parse_position(self, pos_str):
         """Convert algebraic notation to board coordinates."""
@@ -31,12 +41,13 @@ class MinichessGame:
     def play_turn(self):
         self.board.display()
         
-        if self.board.is_checkmate(self.current_player):
+        status = self.board.get_status()
+        if status.result == CHECKMATE:
             winner = 'Black' if self.current_player == 'white' else 'White'
             print(f"Checkmate! {winner} wins!")
             self.game_running = False
             return False
-        elif self.board.is_stalemate(self.current_player):
+        elif status.result == STALEMATE:
             print(f"Stalemate! It's a draw.")
             self.game_running = False
             return False
@@ -46,10 +57,23 @@ class MinichessGame:
         if self.players[self.current_player]:  # AI player
             # Add a small delay to make AI moves visible
             time.sleep(1)
-            start_pos, end_pos = self.players[self.current_player].get_best_move(self.board)
+            ponderer = self.ponderers.get(self.current_player)
+            ponder_hit = ponderer is not None and ponderer.is_hit(self.board)
+            result = ponderer.wait() if ponder_hit else None
+            if result is None:
+                if ponder_hit:
+                    print(f"Ponder search failed ({ponderer.error!r}), searching again.")
+                    ponder_hit = False
+                elif ponderer:
+                    ponderer.cancel()
+                result = self.players[self.current_player].search(self.board)
+            (start_pos, end_pos), stats = result
             if self.board.move_piece(start_pos, end_pos):
                 print(f"AI moves from {chr(start_pos[0] + ord('a'))}{start_pos[1]+1} "
                       f"to {chr(end_pos[0] + ord('a'))}{end_pos[1]+1}")
+                print(f"  ({'ponder hit, ' if ponder_hit else ''}{stats.summary()})")
+                if ponderer:
+                    ponderer.start(self.board)
             else:
                 print("AI move failed.")
                 self.game_running = False
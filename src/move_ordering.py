@@ -0,0 +1,90 @@
+from .piece import Pawn, Rook, Knight, Bishop, Queen, King
+
+# Victim/attacker ranks for MVV-LVA; only their order matters
+ORDER_VALUES = {Pawn: 1, Knight: 3, Bishop: 3, Rook: 5, Queen: 9, King: 20}
+
+_HASH_MOVE_SCORE = 1 << 30
+_CAPTURE_SCORE = 1 << 28
+_KILLER_SCORES = (1 << 27, (1 << 27) - 1)
+_HISTORY_LIMIT = 1 << 26
+MAX_PLY = 64
+
+
+def _square(position):
+    return position[1] * 5 + position[0]
+
+
+class MoveOrderer:
+    """Orders moves so alpha-beta meets its cutoffs early.
+
+    The hash move is tried first, then captures by most valuable victim /
+    least valuable attacker, then the two killer moves of the ply, then
+    the remaining quiet moves by their butterfly history score.
+    """
+
+    def __init__(self):
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        # history[color][from_square * 30 + to_square]
+        self.history = {'white': [0] * 900, 'black': [0] * 900}
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def new_search(self):
+        """Forget killers and age the history so older searches count less."""
+        for slots in self.killers:
+            slots[0] = slots[1] = None
+        for table in self.history.values():
+            for i in range(900):
+                table[i] >>= 1
+
+    def order_moves(self, board, moves, ply, hash_move=None):
+        """Return moves sorted best-first for the side to move."""
+        grid = board.board
+        killers = self.killers[ply] if ply < MAX_PLY else (None, None)
+        history = self.history[board.current_turn]
+        scored = []
+        for move in moves:
+            start, end = move
+            if move == hash_move:
+                score = _HASH_MOVE_SCORE
+            else:
+                victim = grid[end[1]][end[0]]
+                if victim:
+                    attacker = grid[start[1]][start[0]]
+                    score = _CAPTURE_SCORE + ORDER_VALUES[type(victim)] * 32 - ORDER_VALUES[type(attacker)]
+                elif move == killers[0]:
+                    score = _KILLER_SCORES[0]
+                elif move == killers[1]:
+                    score = _KILLER_SCORES[1]
+                else:
+                    score = history[_square(start) * 30 + _square(end)]
+            scored.append((score, move))
+        # Stable sort keeps generation order among equally scored moves
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [move for _, move in scored]
+
+    def record_cutoff(self, board, move, ply, depth, move_index, is_capture):
+        """Update statistics, killers and history after move caused a beta cutoff."""
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if is_capture:
+            return
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        history = self.history[board.current_turn]
+        index = _square(move[0]) * 30 + _square(move[1])
+        history[index] = min(history[index] + depth * depth, _HISTORY_LIMIT)
+
+    def stats(self):
+        return {
+            'cutoffs': self.cutoffs,
+            'first_move_cutoffs': self.first_move_cutoffs,
+            'first_move_cutoff_rate': self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+        }
@@ -0,0 +1,63 @@
+import mmap
+import os
+import struct
+from .transposition import encode_move, decode_move
+
+# Written by tools/build_book.py; games use it when present
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 'assets', 'opening_book.bin')
+
+BOOK_MAGIC = b'MCBOOK1\n'
+# One record per position, sorted by key: Zobrist key, encoded move, score for the side to move
+RECORD = struct.Struct('<QHi')
+
+
+def default_book_path():
+    """DEFAULT_BOOK_PATH if a book has been built there, otherwise None."""
+    return DEFAULT_BOOK_PATH if os.path.exists(DEFAULT_BOOK_PATH) else None
+
+
+def write_book(path, entries):
+    """Write a {zobrist key: (move, score)} dict as a book file."""
+    with open(path, 'wb') as book_file:
+        book_file.write(BOOK_MAGIC)
+        for key in sorted(entries):
+            move, score = entries[key]
+            book_file.write(RECORD.pack(key, encode_move(move), score))
+
+
+class OpeningBook:
+    """Read-only opening book, memory-mapped and binary searched by key.
+
+    Lookups unpack single records straight from the mapping, so opening a
+    book costs nothing however many positions it holds.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as book_file:
+            self.data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(BOOK_MAGIC)] != BOOK_MAGIC:
+            self.data.close()
+            raise ValueError(f"{path} is not an opening book")
+        self.count = (len(self.data) - len(BOOK_MAGIC)) // RECORD.size
+
+    def __len__(self):
+        return self.count
+
+    def probe(self, key):
+        """Return (move, score) stored for a position key, or None."""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            record_key, move, score = RECORD.unpack_from(self.data, len(BOOK_MAGIC) + middle * RECORD.size)
+            if record_key < key:
+                low = middle + 1
+            elif record_key > key:
+                high = middle
+            else:
+                return decode_move(move), score
+        return None
+
+    def close(self):
+        self.data.close()
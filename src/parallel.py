@@ -0,0 +1,129 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from .board import Board
+from .position import Position
+from .transposition import SharedTranspositionTable
+from .ai import MinichessAI, SearchTimeout, INFINITY
+
+# Set in each worker process by _init_worker
+_shared_alpha = None
+_shared_tt = None
+_worker_ais = {}
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def _init_worker(shared_alpha, shared_tt):
+    global _shared_alpha, _shared_tt
+    _shared_alpha = shared_alpha
+    _shared_tt = shared_tt
+
+
+def _worker_ai(color, settings):
+    """One engine per color and settings, all probing the shared table."""
+    key = (color, tuple(sorted(settings.items())))
+    ai = _worker_ais.get(key)
+    if ai is None:
+        ai = _worker_ais[key] = MinichessAI(color, tt=_shared_tt, **settings)
+    return ai
+
+
+def _search_root_move(position_bytes, move, depth, settings, deadline):
+    """Search one root move in a worker process.
+
+    The window opens one point below the best score any worker has proven
+    so far, so a move that could still be best gets an exact score while
+    the rest fail low quickly. Returns (move, score or None, nodes); the
+    score is None when the deadline (time.time() based) ran out.
+    """
+    board = Board.from_position(Position.from_bytes(position_bytes))
+    ai = _worker_ai(board.current_turn, settings)
+    ai.start_search(deadline - time.time() if deadline is not None else None)
+    if ai.deadline is not None and ai.deadline <= time.perf_counter():
+        return move, None, 0
+    alpha = _shared_alpha.value
+    board.make_move(move[0], move[1])
+    try:
+        score = -ai.negamax(board, depth - 1, -INFINITY, -(alpha - 1))
+    except SearchTimeout:
+        return move, None, ai.nodes
+    if score >= alpha:
+        with _shared_alpha.get_lock():
+            if score > _shared_alpha.value:
+                _shared_alpha.value = score
+    return move, score, ai.nodes
+
+
+class RootParallelSearch:
+    """Splits the root moves of a search iteration across worker processes.
+
+    Each root move is a separate task, submitted in the serial search
+    order. Workers share the best root score through a
+    multiprocessing.Value, so later moves are searched against the bound
+    earlier ones proved, and one SharedTranspositionTable, so cutoffs
+    found under one root move serve the others. Among equally scored moves the earliest one in
+    the serial order wins, which is the move the serial search keeps.
+    """
+
+    def __init__(self, workers=None, settings=None, tt=None):
+        self.workers = workers or default_workers()
+        self.settings = settings or {}
+        self.tt = SharedTranspositionTable() if tt is None else tt
+        self.shared_alpha = multiprocessing.Value('i', -INFINITY)
+        self.executor = None
+
+    def start(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                initargs=(self.shared_alpha, self.tt))
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def search_root(self, board, moves, depth, deadline=None):
+        """Search the ordered root moves to depth; deadline is a time.time() value.
+
+        Returns (best_move, best_score, nodes, complete). When the deadline
+        interrupts the iteration, complete is False and the best move is
+        taken from the moves that finished.
+        """
+        self.start()
+        with self.shared_alpha.get_lock():
+            self.shared_alpha.value = -INFINITY
+        position_bytes = Position.from_board(board).to_bytes()
+        futures = {
+            self.executor.submit(_search_root_move, position_bytes, move, depth, self.settings, deadline): index
+            for index, move in enumerate(moves)
+        }
+        scores = [None] * len(moves)
+        nodes = 0
+        complete = True
+        pending = set(futures)
+        while pending:
+            timeout = max(0.0, deadline - time.time()) if deadline is not None else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                complete = False
+                for future in pending:
+                    future.cancel()
+                break
+            for future in done:
+                _, score, task_nodes = future.result()
+                nodes += task_nodes
+                if score is None:
+                    complete = False
+                scores[futures[future]] = score
+
+        best_index = None
+        for index, score in enumerate(scores):
+            if score is not None and (best_index is None or score > scores[best_index]):
+                best_index = index
+        if best_index is None:
+            return None, None, nodes, False
+        return moves[best_index], scores[best_index], nodes, complete
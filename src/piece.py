@@ -1,15 +1,20 @@
 class Piece:
+    # Pieces are created in bulk for positions, so avoid a per-instance __dict__
+    __slots__ = ('color', 'position', 'has_moved')
+
     def __init__(self, color, position):
         self.color = color  # 'white' or 'black'
         self.position = position
         self.has_moved = False
 
+    def generate_moves(self, board):
+        """Squares this piece can reach, ignoring whether its own king is left in check."""
+        raise NotImplementedError
+
     def get_possible_moves(self, board, ignore_check=False):
-        moves = []
-        for new_x, new_y in self.generate_moves(board):
-            if ignore_check or not board.would_be_in_check(self.color, self.position, (new_x, new_y)):
-                moves.append((new_x, new_y))
-        return moves
+        if ignore_check:
+            return self.generate_moves(board)
+        return board.get_legal_targets(self, board.get_check_info(self.color))
 
     def is_valid_move(self, board, target_position):
         x, y = target_position
@@ -20,7 +25,9 @@ class Piece:
 
 
 class Pawn(Piece):
-    def get_possible_moves(self, board, ignore_check=False):
+    __slots__ = ()
+
+    def generate_moves(self, board):
         moves = []
         x, y = self.position
         direction = 1 if self.color == 'white' else -1
@@ -41,7 +48,9 @@ class Pawn(Piece):
         return moves
 
 class Rook(Piece):
-    def get_possible_moves(self, board, ignore_check=False):
+    __slots__ = ()
+
+    def generate_moves(self, board):
         moves = []
         directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
         
@@ -64,7 +73,9 @@ class Rook(Piece):
         return moves
     
 class Knight(Piece):
-    def get_possible_moves(self, board, ignore_check=False, ):
+    __slots__ = ()
+
+    def generate_moves(self, board):
         moves = []
         knight_moves = [
             (-2, -1), (-2, 1), (-1, -2), (-1, 2),
@@ -82,7 +93,9 @@ class Knight(Piece):
         return moves
 
 class Bishop(Piece):
-    def get_possible_moves(self, board, ignore_check=False):
+    __slots__ = ()
+
+    def generate_moves(self, board):
         moves = []
         directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
         
@@ -105,7 +118,9 @@ class Bishop(Piece):
         return moves
 
 class Queen(Piece):
-    def get_possible_moves(self, board, ignore_check=False):
+    __slots__ = ()
+
+    def generate_moves(self, board):
         moves = []
         # Combined rook and bishop movements
         directions = [
@@ -132,7 +147,9 @@ class Queen(Piece):
         return moves
 
 class King(Piece):
-    def get_possible_moves(self, board, ignore_check=False):
+    __slots__ = ()
+
+    def generate_moves(self, board):
         moves = []
         # King can move one square in any direction
         directions = [
@@ -146,8 +163,6 @@ class King(Piece):
             if 0 <= new_x < 5 and 0 <= new_y < 6:  # Updated board dimensions
                 target = board.board[new_y][new_x]
                 if target is None or target.color != self.color:
-                    # Check if move would put king in check
-                    if ignore_check or not board.would_be_in_check(self.color, (x, y), (new_x, new_y)):
-                        moves.append((new_x, new_y))
-                        
+                    moves.append((new_x, new_y))
+
         return moves
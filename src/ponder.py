@@ -0,0 +1,80 @@
+import threading
+
+
+class Ponderer:
+    """Searches on the opponent's time for one AI player.
+
+    After the AI moves, start() plays the reply its search expects and
+    searches the resulting position on a background thread. When the
+    opponent has moved, a ponder hit (the real position is the predicted
+    one) reuses that search; on a miss it is stopped, and the real search
+    still finds its work in the shared transposition table. If the ponder
+    search raises, wait() returns None and the exception is kept in error,
+    so the caller can search the position itself.
+    """
+
+    def __init__(self, ai):
+        self.ai = ai
+        self.thread = None
+        self.stop_event = None
+        self.predicted_key = None
+        self.predicted_move = None
+        self.result = None
+        self.error = None
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, board):
+        """Start pondering with the opponent to move on board; returns False if there is no prediction."""
+        self.cancel()
+        move = self.ai.predicted_reply(board)
+        if move is None:
+            return False
+        position = board.copy()
+        position.make_move(*move)
+        if position.get_status().is_over:
+            return False
+        self.predicted_key = position.zobrist_key
+        self.predicted_move = move
+        self.result = None
+        self.error = None
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(position,), daemon=True)
+        self.thread.start()
+        return True
+
+    def run(self, position):
+        try:
+            self.result = self.ai.search(position, stop_event=self.stop_event)
+        except Exception as error:
+            self.error = error
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def is_hit(self, board):
+        """Whether the ponder search is for the position on board; counts the hit or miss."""
+        if self.thread is None:
+            return False
+        hit = board.zobrist_key == self.predicted_key
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return hit
+
+    def wait(self):
+        """Let the ponder search finish and return its (move, stats), or None if it failed."""
+        self.thread.join()
+        self.thread = None
+        return self.result
+
+    def cancel(self):
+        """Stop pondering and discard the result."""
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.result = None
@@ -0,0 +1,142 @@
+from .piece import Pawn, Rook, Knight, Bishop, Queen, King
+
+# One byte per square: piece code 1-6, plus BLACK for black pieces, 0 when empty
+PIECE_CODES = {Pawn: 1, Knight: 2, Bishop: 3, Rook: 4, Queen: 5, King: 6}
+CODE_PIECES = {code: piece_type for piece_type, code in PIECE_CODES.items()}
+BLACK = 8
+
+FEN_LETTERS = {Pawn: 'p', Knight: 'n', Bishop: 'b', Rook: 'r', Queen: 'q', King: 'k'}
+LETTER_PIECES = {letter: piece_type for piece_type, letter in FEN_LETTERS.items()}
+
+START_FEN = 'rnbqk/ppppp/5/5/PPPPP/RNBQK w'
+
+NUM_SQUARES = 30
+# Serialized size: squares, side to move, 32-bit has_moved mask
+POSITION_BYTES = NUM_SQUARES + 1 + 4
+
+
+def format_move(move):
+    """Write a ((x, y), (x, y)) move as coordinates, e.g. 'b2b3'."""
+    (start_x, start_y), (end_x, end_y) = move
+    return f"{chr(start_x + 97)}{start_y + 1}{chr(end_x + 97)}{end_y + 1}"
+
+
+def parse_move(text):
+    """Inverse of format_move."""
+    if len(text) != 4:
+        raise ValueError(f"Invalid move {text!r}")
+    start_x, start_y, end_x, end_y = ord(text[0]) - 97, int(text[1]) - 1, ord(text[2]) - 97, int(text[3]) - 1
+    if not all(0 <= x < 5 for x in (start_x, end_x)) or not all(0 <= y < 6 for y in (start_y, end_y)):
+        raise ValueError(f"Invalid move {text!r}")
+    return ((start_x, start_y), (end_x, end_y))
+
+
+class Position:
+    """Compact snapshot of a board.
+
+    The 30 squares are a bytearray of piece codes indexed by y * 5 + x,
+    next to the side to move and a bitmask of squares whose piece has
+    moved. Cloning a position copies a single 30-byte buffer.
+    """
+    __slots__ = ('squares', 'turn', 'moved')
+
+    def __init__(self, squares=None, turn='white', moved=0):
+        self.squares = bytearray(NUM_SQUARES) if squares is None else squares
+        self.turn = turn
+        self.moved = moved
+
+    @classmethod
+    def from_board(cls, board):
+        squares = bytearray(NUM_SQUARES)
+        moved = 0
+        for y in range(6):
+            for x in range(5):
+                piece = board.board[y][x]
+                if piece:
+                    square = y * 5 + x
+                    squares[square] = PIECE_CODES[type(piece)] | (BLACK if piece.color == 'black' else 0)
+                    if piece.has_moved:
+                        moved |= 1 << square
+        return cls(squares, board.current_turn, moved)
+
+    @classmethod
+    def from_fen(cls, fen):
+        """Parse a FEN-style string: ranks 6 to 1 separated by '/', then 'w' or 'b'.
+
+        Uppercase letters are white pieces, lowercase black, digits count
+        empty squares, e.g. START_FEN.
+        """
+        fields = fen.split()
+        ranks = fields[0].split('/')
+        if len(ranks) != 6:
+            raise ValueError(f"Expected 6 ranks in FEN: {fen!r}")
+        squares = bytearray(NUM_SQUARES)
+        for rank_index, rank in enumerate(ranks):
+            y = 5 - rank_index
+            x = 0
+            for char in rank:
+                if char.isdigit():
+                    x += int(char)
+                    continue
+                if char.lower() not in LETTER_PIECES or x >= 5:
+                    raise ValueError(f"Invalid rank {rank!r} in FEN: {fen!r}")
+                code = PIECE_CODES[LETTER_PIECES[char.lower()]]
+                squares[y * 5 + x] = code if char.isupper() else code | BLACK
+                x += 1
+            if x != 5:
+                raise ValueError(f"Rank {rank!r} does not cover 5 files in FEN: {fen!r}")
+        turn = 'black' if len(fields) > 1 and fields[1] == 'b' else 'white'
+        return cls(squares, turn)
+
+    def to_fen(self):
+        ranks = []
+        for y in range(5, -1, -1):
+            rank = ''
+            empty = 0
+            for x in range(5):
+                code = self.squares[y * 5 + x]
+                if not code:
+                    empty += 1
+                    continue
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                letter = FEN_LETTERS[CODE_PIECES[code & 7]]
+                rank += letter if code & BLACK else letter.upper()
+            if empty:
+                rank += str(empty)
+            ranks.append(rank)
+        return '/'.join(ranks) + (' b' if self.turn == 'black' else ' w')
+
+    def copy(self):
+        return Position(bytearray(self.squares), self.turn, self.moved)
+
+    def pieces(self):
+        """Yield (piece class, color, (x, y)) for every occupied square."""
+        for square, code in enumerate(self.squares):
+            if code:
+                color = 'black' if code & BLACK else 'white'
+                yield CODE_PIECES[code & 7], color, (square % 5, square // 5)
+
+    def to_bytes(self):
+        """Serialize to POSITION_BYTES bytes, e.g. for position files."""
+        return bytes(self.squares) + bytes([self.turn == 'black']) + self.moved.to_bytes(4, 'little')
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) != POSITION_BYTES:
+            raise ValueError(f"Expected {POSITION_BYTES} bytes, got {len(data)}")
+        squares = bytearray(data[:NUM_SQUARES])
+        turn = 'black' if data[NUM_SQUARES] else 'white'
+        moved = int.from_bytes(data[NUM_SQUARES + 1:], 'little')
+        return cls(squares, turn, moved)
+
+    def key(self):
+        """Hashable identity of the position (squares and side to move)."""
+        return bytes(self.squares) + (b'b' if self.turn == 'black' else b'w')
+
+    def __eq__(self, other):
+        return isinstance(other, Position) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
@@ -0,0 +1,113 @@
+import json
+import time
+from .position import format_move
+
+
+class SearchStats:
+    """What one call to MinichessAI.search did, for reports and logs.
+
+    Counters cover the whole search. iterations holds one dict per
+    completed depth of the iterative deepening, with the nodes and time
+    it took and its branching factor: its node count divided by the
+    previous iteration's.
+    """
+
+    def __init__(self, color, fen):
+        self.color = color
+        self.fen = fen
+        self.move = None
+        # 'search', 'book' or 'only move'
+        self.source = 'search'
+        self.score = None
+        self.depth = 0
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self.elapsed = 0.0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.null_move_cutoffs = 0
+        self.lmr_researches = 0
+        self.aspiration_researches = 0
+        self.tablebase_hits = 0
+        self.tt = {}
+        self.iterations = []
+        self.started = time.perf_counter()
+
+    @property
+    def nps(self):
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def first_move_cutoff_rate(self):
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def add_iteration(self, depth, nodes, score, move):
+        """Record a completed iteration; nodes is the search total so far."""
+        previous_nodes = sum(iteration['nodes'] for iteration in self.iterations)
+        previous_time = sum(iteration['time'] for iteration in self.iterations)
+        iteration_nodes = nodes - previous_nodes
+        last = self.iterations[-1]['nodes'] if self.iterations else 0
+        self.iterations.append({
+            'depth': depth,
+            'nodes': iteration_nodes,
+            'time': time.perf_counter() - self.started - previous_time,
+            'score': score,
+            'move': format_move(move) if move else None,
+            'branching_factor': iteration_nodes / last if last else None
+        })
+
+    def finish(self, ai, move):
+        """Copy the engine's counters once the search is over."""
+        self.elapsed = time.perf_counter() - self.started
+        self.move = move
+        self.depth = ai.completed_depth
+        self.nodes = ai.nodes
+        self.leaf_evaluations = ai.leaf_evaluations
+        self.cutoffs = ai.orderer.cutoffs
+        self.first_move_cutoffs = ai.orderer.first_move_cutoffs
+        self.null_move_cutoffs = ai.null_move_cutoffs
+        self.lmr_researches = ai.lmr_researches
+        self.aspiration_researches = ai.aspiration_researches
+        self.tablebase_hits = ai.tablebase_hits
+        self.tt = ai.tt.stats()
+        if self.iterations:
+            self.score = self.iterations[-1]['score']
+
+    def to_dict(self):
+        return {
+            'color': self.color,
+            'fen': self.fen,
+            'move': format_move(self.move) if self.move else None,
+            'source': self.source,
+            'score': self.score,
+            'depth': self.depth,
+            'nodes': self.nodes,
+            'leaf_evaluations': self.leaf_evaluations,
+            'time': self.elapsed,
+            'nps': self.nps,
+            'cutoffs': self.cutoffs,
+            'first_move_cutoffs': self.first_move_cutoffs,
+            'first_move_cutoff_rate': self.first_move_cutoff_rate,
+            'null_move_cutoffs': self.null_move_cutoffs,
+            'lmr_researches': self.lmr_researches,
+            'aspiration_researches': self.aspiration_researches,
+            'tablebase_hits': self.tablebase_hits,
+            'tt_hit_rate': self.tt.get('hit_rate', 0.0),
+            'tt_hits': self.tt.get('hits', 0),
+            'tt_misses': self.tt.get('misses', 0),
+            'iterations': self.iterations
+        }
+
+    def summary(self):
+        """One line for terminal output."""
+        if self.source != 'search':
+            return self.source
+        return (f"depth {self.depth}  score {self.score}  nodes {self.nodes}  "
+                f"{self.nps:,.0f} nps  {self.elapsed:.2f}s  "
+                f"first-move cutoffs {self.first_move_cutoff_rate:.0%}  "
+                f"tt hits {self.tt.get('hit_rate', 0.0):.0%}")
+
+    def write(self, path):
+        """Append the statistics to a JSON-lines file."""
+        with open(path, 'a') as log_file:
+            log_file.write(json.dumps(self.to_dict()) + '\n')
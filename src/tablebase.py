@@ -0,0 +1,264 @@
+import itertools
+import mmap
+import os
+from array import array
+from .bitboard import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE, BLACK, NUM_SQUARES,
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSHES, PIECE_INDEX, COLOR_INDEX,
+    rook_attacks, bishop_attacks, iter_bits
+)
+
+# Written by tools/build_tablebases.py; games use them when present
+DEFAULT_TABLEBASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     'assets', 'tablebases')
+
+TABLE_MAGIC = b'MCTB001\n'
+TABLE_SUFFIX = '.tb'
+MAX_PIECES = 4
+LETTERS = 'PNBRQK'
+
+# Added to a position's move counter when one of its captures reaches a draw,
+# so retrograde analysis can never mark it lost
+_DRAW_GUARD = 1000
+
+
+def default_tablebase_dir():
+    """DEFAULT_TABLEBASE_DIR if tables have been built there, otherwise None."""
+    return DEFAULT_TABLEBASE_DIR if os.path.isdir(DEFAULT_TABLEBASE_DIR) else None
+
+
+def material_name(white, black):
+    """Table name for the non-king piece types of each side, e.g. 'KRvKP'."""
+    return ('K' + ''.join(LETTERS[t] for t in sorted(white, reverse=True))
+            + 'vK' + ''.join(LETTERS[t] for t in sorted(black, reverse=True)))
+
+
+def is_canonical(white, black):
+    """Tables are stored with the side holding more (then stronger) material as white."""
+    return (len(white), sorted(white, reverse=True)) >= (len(black), sorted(black, reverse=True))
+
+
+def material_sets(max_pieces=MAX_PIECES):
+    """Canonical (white, black) piece types of every table, smaller tables first."""
+    types = (QUEEN, ROOK, BISHOP, KNIGHT, PAWN)
+    sets = {}
+    for extra in range(1, max_pieces - 1):
+        for white_count in range(extra + 1):
+            for white in itertools.combinations_with_replacement(types, white_count):
+                for black in itertools.combinations_with_replacement(types, extra - white_count):
+                    if is_canonical(white, black):
+                        sets.setdefault(material_name(white, black), (white, black))
+    return list(sets.values())
+
+
+def _mirror(square):
+    """Reflect a square across the middle of the board, rank 1 to rank 6."""
+    return (5 - square // 5) * 5 + square % 5
+
+
+def locate(placed, turn):
+    """Return (table name, index) of pieces given as (type, color, square) tuples.
+
+    Positions whose material is stored the other way round are mirrored
+    and have their colors swapped first. The index packs the squares of
+    white king, black king, white pieces and black pieces in base 30,
+    followed by the side to move.
+    """
+    white = sorted(((t, square) for t, color, square in placed if color == WHITE), reverse=True)
+    black = sorted(((t, square) for t, color, square in placed if color == BLACK), reverse=True)
+    if not is_canonical([t for t, _ in white[1:]], [t for t, _ in black[1:]]):
+        white, black = ([(t, _mirror(square)) for t, square in black],
+                        [(t, _mirror(square)) for t, square in white])
+        turn = 1 - turn
+    index = white[0][1] * NUM_SQUARES + black[0][1]
+    for _, square in white[1:] + black[1:]:
+        index = index * NUM_SQUARES + square
+    return material_name([t for t, _ in white[1:]], [t for t, _ in black[1:]]), index * 2 + turn
+
+
+def _attacks(piece_type, color, square, occupied):
+    if piece_type == PAWN:
+        return PAWN_ATTACKS[color][square]
+    if piece_type == KNIGHT:
+        return KNIGHT_ATTACKS[square]
+    if piece_type == KING:
+        return KING_ATTACKS[square]
+    if piece_type == ROOK:
+        return rook_attacks(square, occupied)
+    if piece_type == BISHOP:
+        return bishop_attacks(square, occupied)
+    return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+
+
+def _attacked(target, by_color, types, colors, squares, occupied, skip):
+    """Whether any piece of by_color, other than piece skip, attacks target."""
+    for i, square in enumerate(squares):
+        if colors[i] == by_color and i != skip and _attacks(types[i], by_color, square, occupied) >> target & 1:
+            return True
+    return False
+
+
+def generate_table(white, black, tablebases):
+    """Solve one material set by retrograde analysis.
+
+    A forward pass visits every placement, marks checkmates and counts each
+    position's legal moves. Captures leave the table, so their results
+    come from the smaller tables in tablebases. Then, one ply at a time,
+    un-moves walk back from the positions decided at the previous ply: a
+    predecessor of a lost position is won, and a position whose every move
+    reaches a won position is lost.
+
+    Returns one byte per index: distance to mate in plies plus one (odd
+    distances are wins for the side to move), or 0 for draws and
+    impossible placements.
+    """
+    types = [KING, KING] + sorted(white, reverse=True) + sorted(black, reverse=True)
+    colors = [WHITE, BLACK] + [WHITE] * len(white) + [BLACK] * len(black)
+    count = len(types)
+    size = 2 * NUM_SQUARES ** count
+    weights = [2 * NUM_SQUARES ** (count - 1 - i) for i in range(count)]
+    result = bytearray(size)
+    legal = bytearray(size)
+    counter = array('H', bytes(2 * size))
+    # Capture results land at the ply after the smaller table's distance
+    wins_at, losses_at = {}, {}
+    decided = []
+
+    for base, squares in enumerate(itertools.product(range(NUM_SQUARES), repeat=count)):
+        occupied = [0, 0]
+        for i, square in enumerate(squares):
+            occupied[colors[i]] |= 1 << square
+        all_occupied = occupied[WHITE] | occupied[BLACK]
+        if bin(all_occupied).count('1') != count:
+            continue
+        for turn in (WHITE, BLACK):
+            index = base * 2 + turn
+            # The side that just moved cannot have left its king attacked
+            if _attacked(squares[1 - turn], turn, types, colors, squares, all_occupied, -1):
+                continue
+            legal[index] = 1
+            moves = 0
+            for i, square in enumerate(squares):
+                if colors[i] != turn:
+                    continue
+                if types[i] == PAWN:
+                    targets = (PAWN_PUSHES[turn][square] & ~all_occupied) | (PAWN_ATTACKS[turn][square] & occupied[1 - turn])
+                else:
+                    targets = _attacks(types[i], turn, square, all_occupied) & ~occupied[turn]
+                for target in iter_bits(targets):
+                    captured = squares.index(target) if all_occupied >> target & 1 else -1
+                    moved = list(squares)
+                    moved[i] = target
+                    if _attacked(moved[turn], 1 - turn, types, colors, moved,
+                                 all_occupied & ~(1 << square) | 1 << target, captured):
+                        continue
+                    moves += 1
+                    if captured < 0:
+                        continue
+                    placed = [(types[j], colors[j], moved[j]) for j in range(count) if j != captured]
+                    value = tablebases.probe_pieces(placed, 1 - turn)
+                    if not value:
+                        counter[index] = _DRAW_GUARD
+                    elif value % 2:
+                        wins_at.setdefault(value, []).append(index)
+                    else:
+                        losses_at.setdefault(value, []).append(index)
+            if not moves:
+                if _attacked(squares[turn], 1 - turn, types, colors, squares, all_occupied, -1):
+                    result[index] = 1
+                    decided.append(index)
+                continue
+            counter[index] += moves
+
+    ply = 0
+    while decided or wins_at or losses_at:
+        ply += 1
+        found = []
+        for index in wins_at.pop(ply, ()):
+            if not result[index]:
+                result[index] = ply + 1
+                found.append(index)
+        for index in losses_at.pop(ply, ()):
+            counter[index] -= 1
+            if not counter[index] and not result[index]:
+                result[index] = ply + 1
+                found.append(index)
+        previous_lost = ply % 2 == 1
+        for index in decided:
+            turn = index & 1
+            mover = 1 - turn
+            base = index >> 1
+            squares = [0] * count
+            for i in range(count - 1, -1, -1):
+                base, squares[i] = divmod(base, NUM_SQUARES)
+            all_occupied = 0
+            for square in squares:
+                all_occupied |= 1 << square
+            for i, square in enumerate(squares):
+                if colors[i] != mover:
+                    continue
+                if types[i] == PAWN:
+                    sources = PAWN_PUSHES[1 - mover][square] & ~all_occupied
+                else:
+                    sources = _attacks(types[i], mover, square, all_occupied) & ~all_occupied
+                for source in iter_bits(sources):
+                    predecessor = index + mover - turn + (source - square) * weights[i]
+                    if not legal[predecessor] or result[predecessor]:
+                        continue
+                    if previous_lost:
+                        result[predecessor] = ply + 1
+                        found.append(predecessor)
+                    else:
+                        counter[predecessor] -= 1
+                        if not counter[predecessor]:
+                            result[predecessor] = ply + 1
+                            found.append(predecessor)
+        decided = found
+    return result
+
+
+def write_table(path, data):
+    with open(path, 'wb') as table_file:
+        table_file.write(TABLE_MAGIC)
+        table_file.write(data)
+
+
+class Tablebases:
+    """Endgame tables for small material, memory-mapped from a directory.
+
+    A probe returns the table byte of a position: distance to mate in
+    plies plus one, odd distances being wins for the side to move, or 0
+    for a draw. Positions with no table return None.
+    """
+
+    def __init__(self, directory=None):
+        self.tables = {}
+        self.max_pieces = 2
+        if directory is None:
+            return
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(TABLE_SUFFIX):
+                with open(os.path.join(directory, filename), 'rb') as table_file:
+                    data = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+                if data[:len(TABLE_MAGIC)] != TABLE_MAGIC:
+                    raise ValueError(f"{filename} is not a tablebase file")
+                self.add(filename[:-len(TABLE_SUFFIX)], memoryview(data)[len(TABLE_MAGIC):])
+
+    def add(self, name, table):
+        self.tables[name] = table
+        self.max_pieces = max(self.max_pieces, len(name) - 1)
+
+    def probe_pieces(self, placed, turn):
+        """Probe (type, color, square) pieces with WHITE or BLACK to move."""
+        if len(placed) == 2:
+            return 0
+        name, index = locate(placed, turn)
+        table = self.tables.get(name)
+        return None if table is None else table[index]
+
+    def probe(self, board):
+        placed = [
+            (PIECE_INDEX[type(piece)], COLOR_INDEX[piece.color], piece.position[1] * 5 + piece.position[0])
+            for color in ('white', 'black') for piece in board.piece_lists[color]
+        ]
+        return self.probe_pieces(placed, COLOR_INDEX[board.current_turn])
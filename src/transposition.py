@@ -0,0 +1,215 @@
+import os
+import weakref
+from array import array
+from multiprocessing import shared_memory
+
+# Bound types stored with each score
+EXACT, LOWER_BOUND, UPPER_BOUND = 1, 2, 3
+
+# Each entry is two 64-bit words: the position key and the packed data below
+ENTRY_BYTES = 16
+BUCKET_SLOTS = 2  # slot 0 is depth-preferred, slot 1 is always-replace
+
+# Packed data layout: score (32 bits, offset) | move (16) | depth (8) | bound (2) | generation (6)
+_SCORE_OFFSET = 1 << 31
+_MOVE_SHIFT = 32
+_DEPTH_SHIFT = 48
+_BOUND_SHIFT = 56
+_GENERATION_SHIFT = 58
+_GENERATIONS = 64
+
+
+def encode_move(move):
+    """Pack a ((x, y), (x, y)) move into a 16-bit int; 0 means no move."""
+    if move is None:
+        return 0
+    (start_x, start_y), (end_x, end_y) = move
+    return (start_y * 5 + start_x) * 30 + end_y * 5 + end_x + 1
+
+
+def decode_move(code):
+    """Inverse of encode_move."""
+    if not code:
+        return None
+    start, end = divmod(code - 1, 30)
+    return ((start % 5, start // 5), (end % 5, end // 5))
+
+
+class TranspositionTable:
+    """Fixed-size, preallocated transposition table.
+
+    The table is a power-of-two number of two-slot buckets held in flat
+    arrays, so its memory use is decided once by size_mb and never grows.
+    New results replace the depth-preferred slot when they are searched at
+    least as deep (or that slot is left over from an earlier search);
+    otherwise they go to the always-replace slot.
+    """
+
+    def __init__(self, size_mb=16):
+        buckets = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * BUCKET_SLOTS))
+        buckets = 1 << (buckets.bit_length() - 1)
+        self.size_mb = size_mb
+        self.bucket_mask = buckets - 1
+        self.keys, self.data = self.allocate(buckets * BUCKET_SLOTS)
+        self.generation = 0
+        self.reset_stats()
+
+    def allocate(self, entries):
+        """Allocate the key and data arrays for the given number of entries."""
+        return array('Q', bytes(8 * entries)), array('Q', bytes(8 * entries))
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+
+    def new_search(self):
+        """Age existing entries so a new search may overwrite them."""
+        self.generation = (self.generation + 1) % _GENERATIONS
+
+    def clear(self):
+        self.keys, self.data = self.allocate(len(self.keys))
+        self.generation = 0
+
+    def read_slot(self, index):
+        """Return (key, data) stored in a slot."""
+        return self.keys[index], self.data[index]
+
+    def write_slot(self, index, key, data):
+        self.keys[index] = key
+        self.data[index] = data
+
+    def probe(self, key):
+        """Look up a position and return (depth, bound, score, move) or None."""
+        index = (key & self.bucket_mask) * BUCKET_SLOTS
+        occupied = False
+        for slot in (index, index + 1):
+            slot_key, data = self.read_slot(slot)
+            if slot_key == key and data:
+                self.hits += 1
+                return (
+                    (data >> _DEPTH_SHIFT) & 0xFF,
+                    (data >> _BOUND_SHIFT) & 0x3,
+                    (data & 0xFFFFFFFF) - _SCORE_OFFSET,
+                    decode_move((data >> _MOVE_SHIFT) & 0xFFFF)
+                )
+            if data:
+                occupied = True
+        self.misses += 1
+        if occupied:
+            self.collisions += 1
+        return None
+
+    def store(self, key, depth, bound, score, move=None):
+        """Store a search result, following the bucket replacement policy."""
+        data = ((score + _SCORE_OFFSET)
+                | (encode_move(move) << _MOVE_SHIFT)
+                | (max(0, min(depth, 0xFF)) << _DEPTH_SHIFT)
+                | (bound << _BOUND_SHIFT)
+                | (self.generation << _GENERATION_SHIFT))
+        index = (key & self.bucket_mask) * BUCKET_SLOTS
+        preferred_key, preferred_data = self.read_slot(index)
+        preferred_depth = (preferred_data >> _DEPTH_SHIFT) & 0xFF
+        stale = (preferred_data >> _GENERATION_SHIFT) != self.generation
+        self.stores += 1
+
+        if preferred_key == key:
+            if depth >= preferred_depth or bound == EXACT or stale:
+                self.write_slot(index, key, data)
+        elif not preferred_data or stale or depth >= preferred_depth:
+            # Keep the displaced entry in the always-replace slot
+            if preferred_data:
+                self.write_slot(index + 1, preferred_key, preferred_data)
+            self.write_slot(index, key, data)
+        else:
+            self.write_slot(index + 1, key, data)
+
+    def stats(self):
+        """Counters for reporting cache effectiveness."""
+        probes = self.hits + self.misses
+        return {
+            'size_mb': self.size_mb,
+            'entries': len(self.keys),
+            'hits': self.hits,
+            'misses': self.misses,
+            'collisions': self.collisions,
+            'stores': self.stores,
+            'hit_rate': self.hits / probes if probes else 0.0
+        }
+
+
+def _release(shm, views, owner_pid):
+    """Close a shared table's block, releasing the views into it first."""
+    for view in views:
+        view.release()
+    shm.close()
+    if os.getpid() == owner_pid:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """Transposition table in a multiprocessing.shared_memory block.
+
+    Every process that attaches to the block reads and writes the same
+    entries without locks. Each key slot holds key ^ data, so an entry torn
+    by two processes writing at once no longer matches its key and reads
+    as a miss. The generation lives in the block too; only the creating
+    process advances it, once per search. Pickling sends only the block
+    name, so a table passed to a worker process attaches to the same memory.
+    The creator is recorded by pid, so a forked worker that inherits the
+    object as is still counts as an attached process.
+    """
+
+    def __init__(self, size_mb=16, name=None):
+        self.name = name
+        self.owner_pid = os.getpid() if name is None else None
+        super().__init__(size_mb)
+
+    @property
+    def owner(self):
+        return os.getpid() == self.owner_pid
+
+    def __reduce__(self):
+        return SharedTranspositionTable, (self.size_mb, self.shm.name)
+
+    def allocate(self, entries):
+        size = 8 + 16 * entries
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=self.name)
+        buffer = self.shm.buf
+        self.header = buffer[:8].cast('Q')
+        keys, data = buffer[8:8 + 8 * entries].cast('Q'), buffer[8 + 8 * entries:size].cast('Q')
+        self.finalizer = weakref.finalize(self, _release, self.shm, (self.header, keys, data), self.owner_pid)
+        return keys, data
+
+    @property
+    def generation(self):
+        return self.header[0]
+
+    @generation.setter
+    def generation(self, value):
+        if self.owner:
+            self.header[0] = value
+
+    def clear(self):
+        entries = len(self.keys)
+        self.shm.buf[8:8 + 16 * entries] = bytes(16 * entries)
+        self.generation = 0
+
+    def read_slot(self, index):
+        data = self.data[index]
+        return self.keys[index] ^ data, data
+
+    def write_slot(self, index, key, data):
+        self.keys[index] = key ^ data
+        self.data[index] = data
+
+    def close(self):
+        """Detach from the block; the creating process also frees it."""
+        self.finalizer()
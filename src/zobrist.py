@@ -0,0 +1,33 @@
+import random
+from .piece import Pawn, Rook, Knight, Bishop, Queen, King
+
+# Fixed seed so keys (and anything stored under them) are stable across runs
+_rng = random.Random(0x5EED_C0DE)
+
+# PIECE_KEYS[piece class][color][y * 5 + x]
+PIECE_KEYS = {
+    piece_type: {color: [_rng.getrandbits(64) for _ in range(30)] for color in ('white', 'black')}
+    for piece_type in (Pawn, Knight, Bishop, Rook, Queen, King)
+}
+
+# XORed in whenever black is to move
+BLACK_TO_MOVE = _rng.getrandbits(64)
+
+
+def piece_key(piece, position):
+    """Key of one piece standing on (x, y)."""
+    x, y = position
+    return PIECE_KEYS[type(piece)][piece.color][y * 5 + x]
+
+
+def compute_key(board):
+    """Compute the Zobrist key of a board from scratch."""
+    key = 0
+    for y in range(6):
+        for x in range(5):
+            piece = board.board[y][x]
+            if piece:
+                key ^= PIECE_KEYS[type(piece)][piece.color][y * 5 + x]
+    if board.current_turn == 'black':
+        key ^= BLACK_TO_MOVE
+    return key
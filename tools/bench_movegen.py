@@ -0,0 +1,70 @@
+"""Compare move generation speed of Board (src/piece.py) against BitBoard.
+
+Usage: python tools/bench_movegen.py [positions] [repeats]
+"""
+import sys
+import os
+import random
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.bitboard import BitBoard
+
+
+def board_moves(board, color):
+    """Legal moves generated the way MinichessAI.get_all_moves does."""
+    return board.get_legal_moves(color)
+
+
+def sample_positions(count, seed=1):
+    """Collect positions from random playouts of the start position."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board()
+        for _ in range(rng.randint(0, 30)):
+            moves = board_moves(board, board.current_turn)
+            if not moves:
+                break
+            board.make_move(*rng.choice(moves))
+        positions.append(board)
+    return positions
+
+
+def time_it(func, items, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for item in items:
+            func(item)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    boards = sample_positions(count)
+    bitboards = [BitBoard.from_board(board) for board in boards]
+
+    # Both engines must agree before their speed means anything
+    for board, bitboard in zip(boards, bitboards):
+        color = board.current_turn
+        assert sorted(board_moves(board, color)) == sorted(bitboard.get_legal_moves(color))
+        assert board.is_in_check(color) == bitboard.is_in_check(color)
+
+    rows = [
+        ('legal moves', lambda b: board_moves(b, b.current_turn), lambda b: b.generate_legal_moves(b.current_turn)),
+        ('is_in_check', lambda b: b.is_in_check(b.current_turn), lambda b: b.is_in_check(b.current_turn)),
+    ]
+    print(f"{count} positions x {repeats} repeats")
+    print(f"{'operation':<14}{'Board (s)':>12}{'BitBoard (s)':>14}{'speed-up':>10}")
+    for name, board_func, bitboard_func in rows:
+        board_time = time_it(board_func, boards, repeats)
+        bitboard_time = time_it(bitboard_func, bitboards, repeats)
+        print(f"{name:<14}{board_time:>12.3f}{bitboard_time:>14.3f}{board_time / bitboard_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measure root-parallel search scaling against the serial search.
+
+Usage: python tools/bench_parallel.py [depth] [workers ...]
+"""
+import sys
+import os
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.ai import MinichessAI
+from bench_search import POSITIONS
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def run(depth, workers):
+    """Search every position with fresh engines; return (moves, nodes, seconds)."""
+    moves = []
+    nodes = 0
+    elapsed = 0.0
+    for fen in POSITIONS:
+        board = Board.from_fen(fen)
+        ai = MinichessAI(board.current_turn, depth=depth, workers=workers)
+        if workers is not None:
+            # Start the pool outside the timing, as a game would reuse it
+            ai.search_root_parallel(board, ai.get_all_moves(board, ai.color), 1, None)
+        start = time.perf_counter()
+        moves.append(ai.get_best_move(board))
+        elapsed += time.perf_counter() - start
+        nodes += ai.nodes
+        ai.close()
+    return moves, nodes, elapsed
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    counts = [int(arg) for arg in sys.argv[2:]] or WORKER_COUNTS
+    print(f"Depth {depth}, {len(POSITIONS)} positions, {os.cpu_count()} CPUs")
+
+    serial_moves, serial_nodes, serial_time = run(depth, None)
+    print(f"{'workers':>8}{'nodes':>12}{'time (s)':>10}{'speedup':>9}{'same move':>11}")
+    print(f"{'serial':>8}{serial_nodes:>12}{serial_time:>10.2f}{1.0:>8.2f}x{len(POSITIONS):>9}/{len(POSITIONS)}")
+    for workers in counts:
+        moves, nodes, elapsed = run(depth, workers)
+        same = sum(a == b for a, b in zip(moves, serial_moves))
+        print(f"{workers:>8}{nodes:>12}{elapsed:>10.2f}{serial_time / elapsed:>8.2f}x{same:>9}/{len(POSITIONS)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare search node counts of plain alpha-beta, PVS, aspiration windows and selective search.
+
+Usage: python tools/bench_search.py [depth]
+"""
+import sys
+import os
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.ai import MinichessAI
+from src.position import START_FEN
+
+# Fixed position set: the start position plus middlegames from seeded random games
+POSITIONS = [
+    START_FEN,
+    '4k/2pp1/bp3/Q2P1/P1P1K/5 w',
+    '2b2/p2kp/2p2/1R2B/P4/4K w',
+    '1r1qk/p2bp/1p1p1/BP3/P1PKP/R1Q2 w',
+    'rn1qk/4p/pPNp1/1Q1PP/bP3/R1BK1 w',
+    'r1b1k/1p1pp/1ppP1/5/PB2P/RN1QK w',
+    'r1bqk/pp1pp/2p2/4P/PPPn1/RNBQK w',
+    'r4/pp2k/4b/BpK1P/P3P/1R3 w',
+]
+
+FULL_WIDTH = {'use_null_move': False, 'use_lmr': False}
+CONFIGURATIONS = [
+    ('alpha-beta', dict(FULL_WIDTH, use_pvs=False, use_aspiration=False)),
+    ('pvs', dict(FULL_WIDTH, use_pvs=True, use_aspiration=False)),
+    ('pvs+aspiration', dict(FULL_WIDTH, use_pvs=True, use_aspiration=True)),
+    ('+null+lmr', {}),
+]
+
+
+def run(name, settings, depth):
+    nodes = []
+    moves = []
+    start = time.perf_counter()
+    for fen in POSITIONS:
+        board = Board.from_fen(fen)
+        ai = MinichessAI(board.current_turn, depth=depth, **settings)
+        moves.append(ai.get_best_move(board))
+        nodes.append(ai.nodes)
+    return nodes, moves, time.perf_counter() - start
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    results = [(name,) + run(name, settings, depth) for name, settings in CONFIGURATIONS]
+    baseline_nodes = sum(results[0][1])
+
+    print(f"Depth {depth}, {len(POSITIONS)} positions")
+    print(f"{'position':<36}" + ''.join(f"{name:>16}" for name, *_ in results))
+    for i, fen in enumerate(POSITIONS):
+        print(f"{fen:<36}" + ''.join(f"{nodes[i]:>16}" for _, nodes, _, _ in results))
+    print(f"{'total nodes':<36}" + ''.join(f"{sum(nodes):>16}" for _, nodes, _, _ in results))
+    print(f"{'vs alpha-beta':<36}" + ''.join(f"{sum(nodes) / baseline_nodes:>15.2f}x" for _, nodes, _, _ in results))
+    print(f"{'time (s)':<36}" + ''.join(f"{elapsed:>16.2f}" for *_, elapsed in results))
+    for name, _, moves, _ in results[1:]:
+        same = sum(a == b for a, b in zip(moves, results[0][2]))
+        print(f"{name}: same move as alpha-beta in {same}/{len(POSITIONS)} positions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Build the opening book by searching every position near the start.
+
+Every position reachable from the start position in fewer than --plies
+moves (either side may be the engine) gets the move a --depth search
+picks for it. The book is written sorted by Zobrist key, by default to
+the location games load it from.
+
+Usage: python tools/build_book.py [--plies 3] [--depth 6] [--output assets/opening_book.bin]
+"""
+import argparse
+import sys
+import os
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.ai import MinichessAI
+from src.opening_book import DEFAULT_BOOK_PATH, OpeningBook, write_book
+from src.position import format_move
+
+
+def book_positions(plies):
+    """Positions reachable in fewer than plies moves, one per Zobrist key, as FENs."""
+    board = Board()
+    seen = {board.zobrist_key: board.to_fen()}
+    frontier = [board.to_fen()]
+    for _ in range(plies - 1):
+        next_frontier = []
+        for fen in frontier:
+            board = Board.from_fen(fen)
+            for move in board.get_legal_moves(board.current_turn):
+                board.make_move(move[0], move[1])
+                if board.zobrist_key not in seen:
+                    seen[board.zobrist_key] = board.to_fen()
+                    next_frontier.append(seen[board.zobrist_key])
+                board.unmake_move()
+        frontier = next_frontier
+    return seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--plies', type=int, default=3, help="book covers positions before this ply")
+    parser.add_argument('--depth', type=int, default=6, help="search depth per position")
+    parser.add_argument('--output', default=DEFAULT_BOOK_PATH)
+    args = parser.parse_args()
+
+    positions = book_positions(args.plies)
+    print(f"{len(positions)} positions, depth {args.depth}")
+    # One engine per color, so later searches reuse the table
+    engines = {color: MinichessAI(color, depth=args.depth) for color in ('white', 'black')}
+    entries = {}
+    start = time.perf_counter()
+    for done, (key, fen) in enumerate(positions.items(), 1):
+        board = Board.from_fen(fen)
+        ai = engines[board.current_turn]
+        move = ai.get_best_move(board)
+        if move is None:
+            continue
+        entry = ai.tt.probe(key)
+        entries[key] = (move, entry[2] if entry else 0)
+        if done % 50 == 0 or done == len(positions):
+            print(f"  {done}/{len(positions)}  {time.perf_counter() - start:.1f}s")
+
+    write_book(args.output, entries)
+    book = OpeningBook(args.output)
+    print(f"Wrote {len(book)} positions to {args.output}")
+    first = book.probe(Board().zobrist_key)
+    if first:
+        print(f"Start position: {format_move(first[0])} ({first[1]:+d})")
+    book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Generate endgame tablebases for every 3- and 4-piece material set.
+
+Tables are solved smallest first, since captures look up the smaller
+sets, and written as <name>.tb files, by default to the directory games
+load them from. Existing files are reused unless --force is given.
+
+Usage: python tools/build_tablebases.py [--pieces 4] [--output assets/tablebases] [--force] [SET ...]
+"""
+import argparse
+import sys
+import os
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tablebase import (
+    DEFAULT_TABLEBASE_DIR, TABLE_SUFFIX, MAX_PIECES, Tablebases,
+    generate_table, material_name, material_sets, write_table
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sets', nargs='*', help="only these tables, e.g. KQvK KRvKP (smaller ones are built as needed)")
+    parser.add_argument('--pieces', type=int, default=MAX_PIECES, help="largest number of pieces, kings included")
+    parser.add_argument('--output', default=DEFAULT_TABLEBASE_DIR)
+    parser.add_argument('--force', action='store_true', help="regenerate tables that already exist")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    tablebases = Tablebases(None if args.force else args.output)
+    largest = max(len(name) - 1 for name in args.sets) if args.sets else args.pieces
+    for white, black in material_sets(largest):
+        name = material_name(white, black)
+        if name in tablebases.tables:
+            continue
+        if args.sets and len(name) - 1 == largest and name not in args.sets:
+            continue
+        start = time.perf_counter()
+        table = generate_table(white, black, tablebases)
+        write_table(os.path.join(args.output, name + TABLE_SUFFIX), table)
+        tablebases.add(name, table)
+
+        decided = len(table) - table.count(0)
+        longest = max(table) - 1 if decided else 0
+        print(f"{name:<8} {len(table):>9} entries  {decided:>8} won or lost  "
+              f"longest mate {longest:>3} plies  {time.perf_counter() - start:6.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Score a file of positions with the NumPy batch evaluator.
+
+The file is either one FEN per line or a .bin file of packed positions.
+Scores are from the side to move's point of view, as the search uses
+them, and are checked against the incremental board evaluation on a
+sample. --sample N first writes N positions from random games to FILE.
+--children instead scores every legal move of every position, one batch
+per position, from the point of view of the side making the move.
+
+Usage: python tools/evaluate_positions.py FILE [--sample N] [--children] [--output scores.txt]
+"""
+import argparse
+import random
+import sys
+import os
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.position import Position, format_move
+from src.batch_eval import (
+    encode_planes, evaluate_planes, evaluate_children, read_position_file, write_position_file
+)
+
+CHECK_SAMPLE = 1000
+
+
+def random_positions(count, seed=0):
+    """Positions from random games, sampled along each game."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board()
+        for _ in range(rng.randrange(1, 60)):
+            moves = board.get_legal_moves(board.current_turn)
+            if not moves:
+                break
+            board.make_move(*rng.choice(moves))
+            positions.append(board.to_position())
+    return positions[:count]
+
+
+def board_at(squares, black_to_move, index):
+    turn = 'black' if black_to_move[index] else 'white'
+    return Board.from_position(Position(bytearray(squares[index].tobytes()), turn))
+
+
+def score_children(squares, black_to_move, output=None):
+    """Score the children of every position and check a sample against Board.eval_score."""
+    results = []
+    start = time.perf_counter()
+    for index in range(len(squares)):
+        board = board_at(squares, black_to_move, index)
+        moves = board.get_legal_moves(board.current_turn)
+        scores = evaluate_children(board, moves)
+        if board.current_turn == 'black':
+            scores = -scores
+        results.append((board, moves, scores))
+    elapsed = time.perf_counter() - start
+    children = sum(len(moves) for _, moves, _ in results)
+    print(f"{children} children of {len(results)} positions in {elapsed:.3f}s "
+          f"({children / max(elapsed, 1e-9):,.0f} children/s, including move generation)")
+
+    for board, moves, scores in results[::max(1, len(results) // CHECK_SAMPLE)]:
+        for move, score in zip(moves, scores.tolist()):
+            board.make_move(*move)
+            expected = board.eval_score if board.current_turn == 'black' else -board.eval_score
+            board.unmake_move()
+            if score != expected:
+                raise SystemExit(f"Score mismatch for {format_move(move)} in {board.to_fen()}: {score} != {expected}")
+
+    if output:
+        with open(output, 'w') as score_file:
+            for board, moves, scores in results:
+                fen = board.to_fen()
+                score_file.writelines(f"{fen} {format_move(move)} {score}\n"
+                                      for move, score in zip(moves, scores.tolist()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('file')
+    parser.add_argument('--sample', type=int, default=None, help="write this many random positions to FILE first")
+    parser.add_argument('--children', action='store_true', help="score every legal move of each position")
+    parser.add_argument('--output', default=None, help="write one score (with --children: FEN, move, score) per line here")
+    args = parser.parse_args()
+
+    if args.sample:
+        positions = random_positions(args.sample)
+        if args.file.endswith('.bin'):
+            write_position_file(args.file, positions)
+        else:
+            with open(args.file, 'w') as fen_file:
+                fen_file.writelines(position.to_fen() + '\n' for position in positions)
+
+    squares, black_to_move = read_position_file(args.file)
+    if args.children:
+        score_children(squares, black_to_move, args.output)
+        return
+    start = time.perf_counter()
+    scores = evaluate_planes(encode_planes(squares))
+    scores[black_to_move] *= -1
+    elapsed = time.perf_counter() - start
+    print(f"{len(scores)} positions in {elapsed:.3f}s ({len(scores) / max(elapsed, 1e-9):,.0f} positions/s)")
+    if len(scores):
+        print(f"mean {scores.mean():+.1f}  min {scores.min():+d}  max {scores.max():+d}")
+
+    for index in range(0, len(scores), max(1, len(scores) // CHECK_SAMPLE)):
+        board = board_at(squares, black_to_move, index)
+        expected = board.eval_score if board.current_turn == 'white' else -board.eval_score
+        if scores[index] != expected:
+            raise SystemExit(f"Score mismatch for {board.to_fen()}: {scores[index]} != {expected}")
+
+    if args.output:
+        with open(args.output, 'w') as score_file:
+            score_file.writelines(f"{score}\n" for score in scores.tolist())
+
+
+if __name__ == "__main__":
+    main()
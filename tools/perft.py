@@ -0,0 +1,142 @@
+"""Perft: count the leaf nodes of the legal move tree to a fixed depth.
+
+Runs the reference suite and checks every count against REFERENCE, or
+counts a single position (--fen) and prints the per-move split with
+--divide. --engine bitboard runs the same counts on BitBoard, and --hash
+caches subtree counts by Zobrist key (Board only).
+
+Usage: python tools/perft.py [--depth N] [--fen FEN] [--divide] [--hash] [--engine board|bitboard]
+"""
+import argparse
+import sys
+import os
+import time
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.bitboard import BitBoard, square_position
+from src.position import START_FEN, format_move
+
+# (FEN, description, leaf counts for depth 1, 2, ...). Board and BitBoard
+# agree on every count, and the pseudo-legal generator in src/piece.py
+# filtered through Board.would_be_in_check agrees up to depth 5.
+REFERENCE = [
+    (START_FEN, 'start position', [7, 49, 451, 4178, 45840, 503344]),
+    ('r1bqk/ppp1p/2n2/3p1/PPPPP/RNBQK w', 'open centre', [8, 123, 1158, 17784, 193209, 2998308]),
+    ('k4/2K2/4b/5/2R1P/5 w', 'rook, pawn and bishop', [11, 60, 728, 4432, 52500, 337927]),
+    ('N1Q2/5/3k1/5/5/4K w', 'queen and knight', [17, 51, 845, 2123, 36182, 104065]),
+    ('5/1K3/5/1k3/Rb1R1/5 w', 'pinned bishop', [19, 134, 2434, 14657, 251394, 1704172]),
+    ('r1b1k/p1ppq/2np1/2N2/1pPBP/R2QK w', 'middlegame', [17, 292, 4471, 75991, 1184678, 20428528]),
+    ('1nbqk/r1p2/p1P1p/2p1P/P2PK/R1BQ1 b', 'exposed kings', [15, 147, 2135, 26103, 383851, 5106314]),
+]
+
+
+def perft(board, depth, table=None):
+    """Leaf count of board to depth; table, if given, caches counts by (key, depth)."""
+    moves = board.get_legal_moves(board.current_turn)
+    if depth == 1:
+        return len(moves)
+    if table is not None:
+        key = (board.zobrist_key, depth)
+        if key in table:
+            return table[key]
+    nodes = 0
+    for start, end in moves:
+        board.make_move(start, end)
+        nodes += perft(board, depth - 1, table)
+        board.unmake_move()
+    if table is not None:
+        table[key] = nodes
+    return nodes
+
+
+def perft_bitboard(bitboard, depth):
+    moves = bitboard.generate_legal_moves(bitboard.current_turn)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for start, end in moves:
+        bitboard.make_move(start, end)
+        nodes += perft_bitboard(bitboard, depth - 1)
+        bitboard.unmake_move()
+    return nodes
+
+
+def divide(board, depth, engine, table=None):
+    """Leaf count below each root move, as (move text, count) pairs."""
+    if engine == 'bitboard':
+        bitboard = BitBoard.from_board(board)
+        counts = []
+        for start, end in bitboard.generate_legal_moves(bitboard.current_turn):
+            bitboard.make_move(start, end)
+            nodes = perft_bitboard(bitboard, depth - 1) if depth > 1 else 1
+            bitboard.unmake_move()
+            counts.append((format_move((square_position(start), square_position(end))), nodes))
+        return counts
+    counts = []
+    for move in board.get_legal_moves(board.current_turn):
+        board.make_move(*move)
+        counts.append((format_move(move), perft(board, depth - 1, table) if depth > 1 else 1))
+        board.unmake_move()
+    return counts
+
+
+def count(board, depth, engine, table=None):
+    if engine == 'bitboard':
+        return perft_bitboard(BitBoard.from_board(board), depth)
+    return perft(board, depth, table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--depth', type=int, default=None, help="deepest level to count (default 4)")
+    parser.add_argument('--fen', default=None, help="count one position instead of the suite")
+    parser.add_argument('--divide', action='store_true', help="print the count below each root move")
+    parser.add_argument('--hash', action='store_true', help="cache subtree counts by Zobrist key")
+    parser.add_argument('--engine', choices=('board', 'bitboard'), default='board')
+    args = parser.parse_args()
+    if args.hash and args.engine != 'board':
+        parser.error("--hash needs the board engine")
+    if args.divide and not args.fen:
+        parser.error("--divide needs --fen")
+    depth = args.depth or 4
+
+    if args.fen:
+        board = Board.from_fen(args.fen)
+        table = {} if args.hash else None
+        start = time.perf_counter()
+        if args.divide:
+            counts = divide(board, depth, args.engine, table)
+            for move, nodes in sorted(counts):
+                print(f"{move}  {nodes}")
+            nodes = sum(nodes for _, nodes in counts)
+        else:
+            nodes = count(board, depth, args.engine, table)
+        elapsed = time.perf_counter() - start
+        print(f"depth {depth}  nodes {nodes}  {elapsed:.2f}s  {nodes / max(elapsed, 1e-9):,.0f} nodes/s")
+        return
+
+    failed = 0
+    total_nodes = 0
+    total_time = 0.0
+    for fen, description, reference in REFERENCE:
+        for level, expected in enumerate(reference[:depth], 1):
+            board = Board.from_fen(fen)
+            start = time.perf_counter()
+            nodes = count(board, level, args.engine, {} if args.hash else None)
+            elapsed = time.perf_counter() - start
+            total_nodes += nodes
+            total_time += elapsed
+            ok = nodes == expected
+            failed += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {description:<22} depth {level}  {nodes:>9}"
+                  f"{'' if ok else f' (expected {expected})'}  {nodes / max(elapsed, 1e-9):>10,.0f} nodes/s")
+    print(f"{total_nodes} nodes in {total_time:.2f}s ({total_nodes / max(total_time, 1e-9):,.0f} nodes/s)")
+    if failed:
+        raise SystemExit(f"{failed} counts differ from the reference")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Play a headless match between two MinichessAI configurations.
+
+Games start from random openings, each played twice with colors swapped,
+and run on a process pool. Games that run too long or repeat a position
+three times are drawn, and a game where both engines' scores agree that
+one side is far ahead for long enough is adjudicated as a win. The
+summary gives the score, an Elo estimate with a 95% interval, the
+likelihood of superiority and an SPRT verdict, plus the search time and
+nodes each engine used, so strength can be compared per CPU second.
+
+Engines are given as NAME:key=value,... with keys depth, time, nodes,
+tt (MB), book, tablebases and the MinichessAI use_* switches, e.g.
+  python tools/tournament.py --games 200 base:depth=3,use_lmr=0,use_null_move=0 lmr:depth=3
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board, CHECKMATE
+from src.ai import MinichessAI, MATE_BOUND
+from src.opening_book import default_book_path
+from src.tablebase import default_tablebase_dir
+from src.position import format_move, parse_move
+
+# Short engine option names and the MinichessAI arguments they set
+OPTION_NAMES = {'depth': 'depth', 'time': 'time_limit', 'nodes': 'node_limit', 'tt': 'tt_size_mb'}
+
+
+def parse_engine(text):
+    """Parse NAME:key=value,... into (name, MinichessAI keyword arguments)."""
+    name, _, options = text.partition(':')
+    settings = {}
+    for option in filter(None, options.split(',')):
+        key, _, value = option.partition('=')
+        if key in ('depth', 'nodes'):
+            settings[OPTION_NAMES[key]] = None if value == 'none' else int(value)
+        elif key in ('time', 'tt'):
+            settings[OPTION_NAMES[key]] = float(value)
+        elif key == 'book':
+            settings['book_path'] = default_book_path() if value == '1' else None
+        elif key == 'tablebases':
+            settings['tablebase_dir'] = default_tablebase_dir() if value == '1' else None
+        elif key.startswith('use_'):
+            settings[key] = value not in ('0', 'false', 'no')
+        else:
+            raise ValueError(f"Unknown engine option {key!r} in {text!r}")
+    return name, settings
+
+
+def random_opening(rng, plies):
+    """A random line of legal moves from the start position that leaves the game open."""
+    while True:
+        board = Board()
+        moves = []
+        for _ in range(plies):
+            legal = board.get_legal_moves(board.current_turn)
+            if not legal:
+                break
+            move = rng.choice(legal)
+            board.make_move(*move)
+            moves.append(format_move(move))
+        if len(moves) == plies and not board.get_status().is_over:
+            return moves
+
+
+def play_game(opening, white, black, max_plies, adjudicate_score, adjudicate_moves):
+    """Play one game; white and black are MinichessAI keyword arguments.
+
+    Returns a dict with the result from white's point of view (1, 0.5 or
+    0), the reason, the number of plies and each side's search time
+    (wall and CPU) and nodes.
+    """
+    board = Board()
+    for text in opening:
+        board.make_move(*parse_move(text))
+    engines = {color: MinichessAI(color, **settings) for color, settings in (('white', white), ('black', black))}
+    usage = {color: {'time': 0.0, 'cpu': 0.0, 'nodes': 0, 'moves': 0} for color in engines}
+    seen = {}
+    winning_streak = 0
+    result, reason = 0.5, 'move limit'
+    plies = len(opening)
+    while plies < max_plies:
+        status = board.get_status()
+        if status.is_over:
+            if status.result == CHECKMATE:
+                result, reason = (0.0 if status.turn == 'white' else 1.0), 'checkmate'
+            else:
+                result, reason = 0.5, 'stalemate'
+            break
+        seen[board.zobrist_key] = seen.get(board.zobrist_key, 0) + 1
+        if seen[board.zobrist_key] >= 3:
+            result, reason = 0.5, 'repetition'
+            break
+
+        color = board.current_turn
+        start, cpu_start = time.perf_counter(), time.process_time()
+        move, stats = engines[color].search(board)
+        used = usage[color]
+        used['time'] += time.perf_counter() - start
+        used['cpu'] += time.process_time() - cpu_start
+        used['nodes'] += stats.nodes
+        used['moves'] += 1
+
+        # Adjudicate once both sides in turn report the same side far ahead
+        score = stats.score
+        if score is not None and abs(score) >= adjudicate_score and abs(score) < MATE_BOUND:
+            white_score = score if color == 'white' else -score
+            if winning_streak and (winning_streak > 0) == (white_score > 0):
+                winning_streak += 1 if white_score > 0 else -1
+            else:
+                winning_streak = 1 if white_score > 0 else -1
+        else:
+            winning_streak = 0
+        if abs(winning_streak) >= adjudicate_moves:
+            result, reason = (1.0 if winning_streak > 0 else 0.0), 'adjudicated'
+            break
+
+        board.make_move(*move)
+        plies += 1
+
+    for engine in engines.values():
+        engine.close()
+    return {'result': result, 'reason': reason, 'plies': plies, 'usage': usage}
+
+
+def elo_from_score(score):
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+def score_from_elo(elo):
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def match_statistics(wins, draws, losses, elo0, elo1, alpha, beta):
+    """Elo estimate, 95% interval, LOS and SPRT log-likelihood ratio for the first engine."""
+    games = wins + draws + losses
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    margin = 1.96 * math.sqrt(variance / games)
+    decisive = wins + losses
+    los = 0.5 * (1 + math.erf((wins - losses) / math.sqrt(2 * decisive))) if decisive else 0.5
+    # Normal approximation of the trinomial SPRT between elo0 and elo1
+    score0, score1 = score_from_elo(elo0), score_from_elo(elo1)
+    llr = games * (score1 - score0) * (2 * score - score0 - score1) / (2 * variance) if variance else 0.0
+    return {
+        'score': score,
+        'elo': elo_from_score(score),
+        'elo_low': elo_from_score(score - margin),
+        'elo_high': elo_from_score(score + margin),
+        'los': los,
+        'llr': llr,
+        'llr_bounds': (math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    parser.add_argument('engines', nargs=2, help="NAME:key=value,... for each engine")
+    parser.add_argument('--games', type=int, default=100, help="games to play, rounded up to an even number")
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument('--opening-plies', type=int, default=4, help="random moves before the engines take over")
+    parser.add_argument('--max-plies', type=int, default=200, help="draw games that reach this length")
+    parser.add_argument('--adjudicate-score', type=int, default=1000, help="score that counts as decisively ahead")
+    parser.add_argument('--adjudicate-moves', type=int, default=8, help="consecutive moves the score must hold")
+    parser.add_argument('--sprt', type=float, nargs=2, default=None, metavar=('ELO0', 'ELO1'),
+                        help="stop once the SPRT accepts either hypothesis")
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--beta', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-v', '--verbose', action='store_true', help="print every game")
+    args = parser.parse_args()
+
+    (name_a, settings_a), (name_b, settings_b) = (parse_engine(text) for text in args.engines)
+    for settings in (settings_a, settings_b):
+        settings.setdefault('depth', 3)
+    rng = random.Random(args.seed)
+    openings = [random_opening(rng, args.opening_plies) if args.opening_plies else [] for _ in range((args.games + 1) // 2)]
+    # Engine A plays white in even games and black in odd ones
+    jobs = [(opening, settings_a, settings_b) if swap == 0 else (opening, settings_b, settings_a)
+            for opening in openings for swap in (0, 1)]
+
+    print(f"{name_a} vs {name_b}: {len(jobs)} games, {args.workers or os.cpu_count()} workers")
+    wins = draws = losses = 0
+    reasons = {}
+    usage = {name: {'time': 0.0, 'cpu': 0.0, 'nodes': 0, 'moves': 0} for name in (name_a, name_b)}
+    game_time = 0.0
+    sprt = None
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers) as executor:
+        futures = {
+            executor.submit(play_game, opening, white, black, args.max_plies,
+                            args.adjudicate_score, args.adjudicate_moves): index
+            for index, (opening, white, black) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            game = future.result()
+            a_is_white = index % 2 == 0
+            score = game['result'] if a_is_white else 1 - game['result']
+            wins += score == 1
+            draws += score == 0.5
+            losses += score == 0
+            reasons[game['reason']] = reasons.get(game['reason'], 0) + 1
+            for color, used in game['usage'].items():
+                name = name_a if (color == 'white') == a_is_white else name_b
+                for key, value in used.items():
+                    usage[name][key] += value
+            game_time += sum(used['time'] for used in game['usage'].values())
+            if args.verbose:
+                white, black = (name_a, name_b) if a_is_white else (name_b, name_a)
+                print(f"  game {index + 1:>4}  {white} - {black}  {game['result']:g}-{1 - game['result']:g}  "
+                      f"{game['reason']:<11} {game['plies']} plies  opening {' '.join(jobs[index][0])}")
+
+            if args.sprt:
+                llr = match_statistics(wins, draws, losses, args.sprt[0], args.sprt[1], args.alpha, args.beta)
+                low, high = llr['llr_bounds']
+                if llr['llr'] <= low or llr['llr'] >= high:
+                    sprt = 'H1 accepted' if llr['llr'] >= high else 'H0 accepted'
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    games = wins + draws + losses
+    elapsed = time.perf_counter() - start
+    print(f"{games} games in {elapsed:.1f}s ({game_time / games:.2f}s of search per game)")
+    print(f"{name_a}: +{wins} ={draws} -{losses}  ({', '.join(f'{k} {v}' for k, v in sorted(reasons.items()))})")
+    stats = match_statistics(wins, draws, losses, *(args.sprt or (0, 5)), args.alpha, args.beta)
+    print(f"score {stats['score']:.3f}  Elo {stats['elo']:+.1f} [{stats['elo_low']:+.1f}, {stats['elo_high']:+.1f}]  "
+          f"LOS {stats['los']:.1%}")
+    if args.sprt:
+        low, high = stats['llr_bounds']
+        print(f"SPRT elo0={args.sprt[0]:g} elo1={args.sprt[1]:g}: LLR {stats['llr']:.2f} [{low:.2f}, {high:.2f}]  "
+              f"{sprt or 'inconclusive'}")
+    for name, used in usage.items():
+        moves = max(used['moves'], 1)
+        print(f"{name:<12} {used['time'] / moves * 1000:8.1f} ms/move  {used['cpu'] / moves * 1000:8.1f} ms CPU/move  "
+              f"{used['nodes'] / moves:9.0f} nodes/move  {used['nodes'] / max(used['cpu'], 1e-9):9,.0f} nodes/CPU s")
+
+
+if __name__ == "__main__":
+    main()